@@ -11,13 +11,20 @@ Local:  ``uvicorn app:app --reload``
 """
 from __future__ import annotations
 
+import asyncio
+import json
 import os
-from typing import Any, Dict, List
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+from cachetools import TTLCache
+from sse_starlette.sse import EventSourceResponse
 
 from dotenv import load_dotenv
 load_dotenv()
 
-from fastapi import FastAPI, HTTPException, Query, Body
+from fastapi import Depends, FastAPI, HTTPException, Query, Body, Request
 from fastapi.middleware.cors import CORSMiddleware
 
 from ontorag.verbosity import setup_logging, get_logger
@@ -31,9 +38,80 @@ VERBOSITY = int(os.getenv("ONTORAG_VERBOSITY", "0"))
 setup_logging(VERBOSITY)
 _log = get_logger("ontorag.app")
 
+# ── Response cache ───────────────────────────────────────────────────
+#
+# The catalog changes rarely, so idempotent MCP reads are served from an
+# in-process TTL cache: 300s for list/inspect, 60s for searches.  A
+# per-key lock coalesces concurrent misses into a single MCP roundtrip.
+
+_catalog_cache: TTLCache = TTLCache(maxsize=256, ttl=300)
+_search_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+_cache_locks: Dict[Tuple[str, ...], asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
+async def _cached(
+    cache: TTLCache,
+    key: Tuple[str, ...],
+    fetch: Callable[[], Awaitable[Dict[str, Any]]],
+) -> Dict[str, Any]:
+    if key in cache:
+        return cache[key]
+    try:
+        async with _cache_locks[key]:
+            if key in cache:
+                return cache[key]
+            value = await fetch()
+            cache[key] = value
+            return value
+    finally:
+        # Locks only matter while a miss is in flight; dropping the
+        # entry afterwards keeps the table from accumulating one lock
+        # per distinct query string forever.  Waiters already queued
+        # hold the same lock object, so coalescing still works.
+        _cache_locks.pop(key, None)
+
+
+def _invalidate_caches() -> None:
+    _catalog_cache.clear()
+    _search_cache.clear()
+
+
+# ── Streaming delivery ───────────────────────────────────────────────
+
+_SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def _stream_items(data: Dict[str, Any], items_key: str) -> EventSourceResponse:
+    """Deliver a list-shaped MCP result as SSE, one item per event.
+
+    Clients see the first item as soon as it is serialized instead of
+    waiting for the full payload to be encoded in one blob.
+    """
+    items = data.get(items_key) or []
+
+    async def gen():
+        for item in items:
+            yield {"event": items_key, "data": json.dumps(item, ensure_ascii=False)}
+        yield {"event": "done", "data": json.dumps({"count": len(items)})}
+
+    return EventSourceResponse(gen(), ping=15, headers=_SSE_HEADERS)
+
+
 # ── MCP client ───────────────────────────────────────────────────────
 
-_mcp = OntologyCatalogMCPClient(MCP_URL)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create one MCP client for the whole process instead of per request."""
+    app.state.mcp = OntologyCatalogMCPClient(MCP_URL)
+    yield
+    # Tear down the persistent SSE session.
+    await app.state.mcp.aclose()
+
+
+def get_mcp(request: Request) -> OntologyCatalogMCPClient:
+    """FastAPI dependency — the shared MCP client from app state."""
+    return request.app.state.mcp
+
 
 # ── FastAPI app ──────────────────────────────────────────────────────
 
@@ -41,6 +119,7 @@ app = FastAPI(
     title="OntoRAG Ontology Catalog",
     version="0.1.0",
     description="Browse, search, and compose baseline ontologies for OntoRAG via MCP.",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -57,9 +136,9 @@ _log.info("Ontology catalog app starting (mcp=%s)", MCP_URL)
 # ── Health ───────────────────────────────────────────────────────────
 
 @app.get("/")
-async def root():
+async def root(mcp: OntologyCatalogMCPClient = Depends(get_mcp)):
     try:
-        data = await _mcp.list_ontologies()
+        data = await _cached(_catalog_cache, ("list",), mcp.list_ontologies)
         count = data.get("count", 0)
     except Exception:
         count = -1
@@ -79,24 +158,34 @@ def health():
 # ── List ontologies ──────────────────────────────────────────────────
 
 @app.get("/ontologies")
-async def list_ontologies():
+async def list_ontologies(
+    stream: bool = Query(False, description="Deliver results as SSE, one ontology per event"),
+    mcp: OntologyCatalogMCPClient = Depends(get_mcp),
+):
     """List all registered baseline ontologies."""
     _log.debug("GET /ontologies")
     try:
-        return await _mcp.list_ontologies()
+        data = await _cached(_catalog_cache, ("list",), mcp.list_ontologies)
     except Exception as exc:
         _log.info("MCP error: %s", exc)
         raise HTTPException(status_code=502, detail=f"MCP error: {exc}")
 
+    if stream:
+        return _stream_items(data, "ontologies")
+    return data
+
 
 # ── Inspect ontology ────────────────────────────────────────────────
 
 @app.get("/ontologies/{slug}")
-async def inspect_ontology(slug: str):
+async def inspect_ontology(slug: str, mcp: OntologyCatalogMCPClient = Depends(get_mcp)):
     """Inspect a baseline ontology: classes, properties, schema card."""
     _log.debug("GET /ontologies/%s", slug)
     try:
-        data = await _mcp.inspect_ontology(slug)
+        data = await _cached(
+            _catalog_cache, ("inspect", slug),
+            lambda: mcp.inspect_ontology(slug),
+        )
     except Exception as exc:
         _log.info("MCP error: %s", exc)
         raise HTTPException(status_code=502, detail=f"MCP error: {exc}")
@@ -109,26 +198,48 @@ async def inspect_ontology(slug: str):
 # ── Search ───────────────────────────────────────────────────────────
 
 @app.get("/search/classes")
-async def search_classes(q: str = Query(..., min_length=1, description="Search term")):
+async def search_classes(
+    q: str = Query(..., min_length=1, description="Search term"),
+    stream: bool = Query(False, description="Deliver results as SSE, one match per event"),
+    mcp: OntologyCatalogMCPClient = Depends(get_mcp),
+):
     """Search for classes across all registered ontologies."""
     _log.debug("GET /search/classes?q=%s", q)
     try:
-        return await _mcp.search_classes(q)
+        data = await _cached(
+            _search_cache, ("sc", q.lower()),
+            lambda: mcp.search_classes(q),
+        )
     except Exception as exc:
         _log.info("MCP error: %s", exc)
         raise HTTPException(status_code=502, detail=f"MCP error: {exc}")
 
+    if stream:
+        return _stream_items(data, "results")
+    return data
+
 
 @app.get("/search/properties")
-async def search_properties(q: str = Query(..., min_length=1, description="Search term")):
+async def search_properties(
+    q: str = Query(..., min_length=1, description="Search term"),
+    stream: bool = Query(False, description="Deliver results as SSE, one match per event"),
+    mcp: OntologyCatalogMCPClient = Depends(get_mcp),
+):
     """Search for properties (datatype + object) across all ontologies."""
     _log.debug("GET /search/properties?q=%s", q)
     try:
-        return await _mcp.search_properties(q)
+        data = await _cached(
+            _search_cache, ("sp", q.lower()),
+            lambda: mcp.search_properties(q),
+        )
     except Exception as exc:
         _log.info("MCP error: %s", exc)
         raise HTTPException(status_code=502, detail=f"MCP error: {exc}")
 
+    if stream:
+        return _stream_items(data, "results")
+    return data
+
 
 # ── Compose ──────────────────────────────────────────────────────────
 
@@ -138,6 +249,7 @@ async def compose(
         ...,
         examples=[{"slugs": ["foaf", "schema_org"], "target_namespace": ""}],
     ),
+    mcp: OntologyCatalogMCPClient = Depends(get_mcp),
 ):
     """Compose multiple baseline ontologies into a single schema card."""
     slugs = body.get("slugs", [])
@@ -146,7 +258,7 @@ async def compose(
     ns = body.get("target_namespace", "")
     _log.debug("POST /compose slugs=%s", slugs)
     try:
-        return await _mcp.compose(slugs, target_namespace=ns)
+        return await mcp.compose(slugs, target_namespace=ns)
     except Exception as exc:
         _log.info("MCP error: %s", exc)
         raise HTTPException(status_code=502, detail=f"MCP error: {exc}")
@@ -166,6 +278,7 @@ async def add_ontology(
             "tags": ["social"],
         }],
     ),
+    mcp: OntologyCatalogMCPClient = Depends(get_mcp),
 ):
     """Register a new baseline ontology by providing its TTL content."""
     slug = body.get("slug", "").strip()
@@ -175,7 +288,7 @@ async def add_ontology(
 
     _log.debug("POST /ontologies slug=%s", slug)
     try:
-        return await _mcp.add_ontology(
+        result = await mcp.add_ontology(
             slug=slug,
             ttl_content=ttl_content,
             label=body.get("label", ""),
@@ -185,3 +298,16 @@ async def add_ontology(
     except Exception as exc:
         _log.info("MCP error: %s", exc)
         raise HTTPException(status_code=502, detail=f"MCP error: {exc}")
+
+    # The catalog just changed — drop stale cached reads.
+    _invalidate_caches()
+    return result
+
+
+# ── Cache control ────────────────────────────────────────────────────
+
+@app.post("/cache/invalidate")
+async def cache_invalidate():
+    """Clear the response cache (e.g. after out-of-band catalog changes)."""
+    _invalidate_caches()
+    return {"ok": True}
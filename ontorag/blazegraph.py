@@ -1,5 +1,7 @@
 from __future__ import annotations
+import asyncio
 import os
+import httpx
 import requests
 from pathlib import Path
 
@@ -9,10 +11,14 @@ _log = get_logger("ontorag.blazegraph")
 
 BLAZEGRAPH_ENDPOINT = os.getenv("BLAZEGRAPH_ENDPOINT", "http://localhost:9999/blazegraph/namespace/ontorag/sparql")
 
+# One session for all Blazegraph calls — keep-alive avoids a fresh
+# TCP (and TLS) handshake per update/upload.
+_session = requests.Session()
+
 def blazegraph_sparql_update(update_query: str) -> None:
     _log.info("SPARQL UPDATE to %s (%d chars)", BLAZEGRAPH_ENDPOINT, len(update_query))
     _log.debug("Query:\n%s", update_query[:500])
-    r = requests.post(
+    r = _session.post(
         BLAZEGRAPH_ENDPOINT,
         data={"update": update_query},
         headers={"Content-Type": "application/x-www-form-urlencoded"},
@@ -21,9 +27,38 @@ def blazegraph_sparql_update(update_query: str) -> None:
     r.raise_for_status()
     _log.debug("Blazegraph response: %d %s", r.status_code, r.reason)
 
+async def blazegraph_sparql_update_many(
+    update_queries: list[str],
+    max_concurrency: int = 4,
+) -> None:
+    """Run several independent SPARQL UPDATEs concurrently.
+
+    Shares one pooled httpx client across all requests; concurrency is
+    capped so a large batch doesn't overwhelm the Blazegraph writer.
+    """
+    if not update_queries:
+        return
+
+    _log.info("SPARQL UPDATE batch: %d queries (concurrency=%d)", len(update_queries), max_concurrency)
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async with httpx.AsyncClient(timeout=60) as client:
+        async def _one(q: str) -> None:
+            async with sem:
+                r = await client.post(
+                    BLAZEGRAPH_ENDPOINT,
+                    data={"update": q},
+                    headers={"Content-Type": "application/x-www-form-urlencoded"},
+                )
+                r.raise_for_status()
+
+        await asyncio.gather(*(_one(q) for q in update_queries))
+
+
 def blazegraph_upload_ttl(ttl_path: str, graph_iri: str) -> None:
-    ttl = Path(ttl_path).read_bytes()
-    _log.info("Uploading TTL %s (%d bytes) to graph <%s>", ttl_path, len(ttl), graph_iri)
+    path = Path(ttl_path)
+    size = path.stat().st_size
+    _log.info("Uploading TTL %s (%d bytes) to graph <%s>", ttl_path, size, graph_iri)
 
     # Use Blazegraph REST API for bulk loading instead of embedding raw TTL
     # in a SPARQL UPDATE string (which breaks on TTL containing curly braces).
@@ -34,11 +69,14 @@ def blazegraph_upload_ttl(ttl_path: str, graph_iri: str) -> None:
         url += f"&context-uri={graph_iri}"
 
     _log.debug("POST %s", url)
-    r = requests.post(
-        url,
-        data=ttl,
-        headers={"Content-Type": "application/x-turtle"},
-        timeout=120,
-    )
+    # Stream the file handle so large TTL exports are never held in RAM;
+    # requests chunks the body straight from disk.
+    with path.open("rb") as f:
+        r = _session.post(
+            url,
+            data=f,
+            headers={"Content-Type": "application/x-turtle"},
+            timeout=120,
+        )
     r.raise_for_status()
     _log.debug("Blazegraph response: %d %s", r.status_code, r.reason)
@@ -1,9 +1,14 @@
 # dto.py
 from __future__ import annotations
 from pydantic import BaseModel, Field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, timezone
 import hashlib
+import os
+
+def utc_now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
 
 class ProvenanceDTO(BaseModel):
     source_path: str
@@ -31,7 +36,7 @@ class ChunkDTO(BaseModel):
 
     text_hash: str
 
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"))
+    created_at: str = Field(default_factory=utc_now_iso)
 
 
 class DocumentDTO(BaseModel):
@@ -41,23 +46,44 @@ class DocumentDTO(BaseModel):
     content_hash: Optional[str] = None
 
     title: Optional[str] = None
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"))
+    created_at: str = Field(default_factory=utc_now_iso)
 
     chunks: List[ChunkDTO] = Field(default_factory=list)
 
 
+# Digests memoized by (path, size, mtime_ns): ingest steps hash the same
+# unchanged file several times (skip check, document ID, DTO field).
+_HASH_CACHE: Dict[Tuple[str, int, int], str] = {}
+_HASH_CACHE_MAX = 1024
+
+
 def hash_file(file_path: str) -> str:
     """Return the SHA-256 hex digest of a file's raw bytes."""
-    h = hashlib.sha256()
+    st = os.stat(file_path)
+    key = (os.path.abspath(file_path), st.st_size, st.st_mtime_ns)
+    cached = _HASH_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    # file_digest feeds the hash from a reusable buffer in C, skipping
+    # the per-block Python read loop (and lets OpenSSL use SHA-NI).
     with open(file_path, "rb") as f:
-        for block in iter(lambda: f.read(1 << 16), b""):
-            h.update(block)
-    return h.hexdigest()
+        digest = hashlib.file_digest(f, "sha256").hexdigest()
+
+    if len(_HASH_CACHE) >= _HASH_CACHE_MAX:
+        _HASH_CACHE.clear()
+    _HASH_CACHE[key] = digest
+    return digest
+
 
+def stable_document_id(source_path: str, content_hash: Optional[str] = None) -> str:
+    """Content-addressable document ID derived from the file bytes.
 
-def stable_document_id(source_path: str) -> str:
-    """Content-addressable document ID derived from the file bytes."""
-    content_hash = hash_file(source_path)
+    Pass ``content_hash`` when the caller already hashed the file to
+    avoid reading it a second time.
+    """
+    if content_hash is None:
+        content_hash = hash_file(source_path)
     return f"doc_{content_hash[:16]}"
 
 
@@ -67,4 +93,6 @@ def stable_chunk_id(document_id: str, chunk_index: int, page: Optional[int]) ->
 
 
 def hash_text(text: str) -> str:
-    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+    # Chunk fingerprints don't need collision resistance against an
+    # attacker — BLAKE2b-128 is much faster than SHA-1 and half the size.
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
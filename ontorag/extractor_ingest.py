@@ -15,12 +15,16 @@ Both engines produce the same DocumentDTO / ChunkDTO output.
 """
 from __future__ import annotations
 
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from ontorag.dto import (
     DocumentDTO, ChunkDTO, ProvenanceDTO,
-    stable_document_id, stable_chunk_id, hash_text, hash_file,
+    stable_document_id, stable_chunk_id, hash_text, hash_file, utc_now_iso,
 )
 from ontorag.verbosity import get_logger
 
@@ -30,9 +34,27 @@ _log = get_logger("ontorag.extractor_ingest")
 _PAGEINDEX_EXTS = {".pdf"}
 _MARKDOWN_EXTS = {".md", ".markdown"}
 
+# One dispatch table: a single dict probe picks the splitter for a
+# suffix instead of testing each extension set in turn.
+_EXT_SPLITTER = {ext: "pageindex" for ext in _PAGEINDEX_EXTS}
+_EXT_SPLITTER.update({ext: "markdown" for ext in _MARKDOWN_EXTS})
+
+
+_WS_RE = re.compile(r"\s+")
+
 
 def clean_snippet(text: str, max_len: int = 240) -> str:
-    t = " ".join(text.split())
+    # Only the first max_len cleaned chars are kept, so normalize a
+    # bounded prefix instead of whitespace-splitting the whole chunk.
+    # A single regex sub collapses runs in place — no word-list churn.
+    window = text[:max_len * 4]
+    t = _WS_RE.sub(" ", window).strip()
+    if len(t) > max_len:
+        return t[:max_len] + "…"
+    if len(window) == len(text):
+        return t
+    # Pathologically whitespace-heavy prefix — fall back to the full text.
+    t = _WS_RE.sub(" ", text).strip()
     return (t[:max_len] + "…") if len(t) > max_len else t
 
 
@@ -45,28 +67,58 @@ def _flatten_tree(
     pages: List[str],
     path: List[str],
 ) -> List[Dict[str, Any]]:
-    """Recursively flatten a PageIndex tree into leaf chunks."""
+    """Flatten a PageIndex tree into leaf chunks (iterative DFS).
+
+    The breadcrumb is carried down as an already-joined string, so each
+    leaf extends it with one concat instead of re-joining the whole path.
+    """
     results: List[Dict[str, Any]] = []
-    for node in nodes:
+    root_section = " > ".join(path)
+
+    # Pages are joined lazily, on the first leaf that lacks inline text:
+    # trees whose leaves all carry text never pay for the full-document
+    # copy.  Cumulative offsets then let each leaf read its page span
+    # with a single slice instead of joining copies of the same pages.
+    npages = len(pages)
+    pages_joined: Optional[str] = None
+    offsets: List[int] = []
+
+    # Children are pushed reversed so leaves pop in document order.
+    stack = [(node, root_section) for node in reversed(nodes)]
+
+    while stack:
+        node, section = stack.pop()
         title = node.get("title", "")
-        current_path = path + [title] if title else path
-        children = node.get("nodes", [])
+        if title:
+            section = f"{section} > {title}" if section else title
 
+        children = node.get("nodes", [])
         if children:
-            results.extend(_flatten_tree(children, pages, current_path))
-        else:
-            start = node.get("start_index", 0)
-            end = node.get("end_index", start)
-            text = node.get("text") or "\n".join(pages[start:end + 1])
-            if not text.strip():
-                continue
-            results.append({
-                "text": text,
-                "section": " > ".join(current_path),
-                "start_page": start,
-                "end_page": end,
-                "title": title,
-            })
+            stack.extend((child, section) for child in reversed(children))
+            continue
+
+        start = node.get("start_index", 0)
+        end = node.get("end_index", start)
+        text = node.get("text")
+        if not text:
+            if pages_joined is None:
+                pages_joined = "\n".join(pages)
+                offsets = [0] * (npages + 1)
+                pos = 0
+                for idx, p in enumerate(pages):
+                    pos += len(p) + 1
+                    offsets[idx + 1] = pos
+            s, e = max(0, start), min(end, npages - 1)
+            text = pages_joined[offsets[s]:offsets[e + 1] - 1] if s <= e else ""
+        if not text or not _HAS_TEXT(text):
+            continue
+        results.append({
+            "text": text,
+            "section": section,
+            "start_page": start,
+            "end_page": end,
+            "title": title,
+        })
     return results
 
 
@@ -84,36 +136,62 @@ def _get_pageindex_client():
     return PageIndexClient(api_key=api_key)
 
 
-def _poll_until_ready(client, doc_id: str, timeout: int = 300, interval: int = 3) -> None:
+def _poll_until_ready(client, doc_id: str, timeout: int = 300) -> None:
     """Poll document status until processing completes or times out."""
+    _poll_many_until_ready(client, [doc_id], timeout=timeout)
+
+
+def _poll_many_until_ready(client, doc_ids: List[str], timeout: int = 300) -> None:
+    """Poll all pending documents each tick until every one completes.
+
+    Uses exponential backoff (1s doubling, capped at 10s), so a batch of
+    documents waits roughly one processing time instead of N.
+    """
     import time
 
+    pending = set(doc_ids)
+    delay = 1.0
     deadline = time.monotonic() + timeout
-    while time.monotonic() < deadline:
-        meta = client.get_document(doc_id)
-        status = meta.get("status", "")
-        if status == "completed":
+
+    while pending:
+        for doc_id in list(pending):
+            meta = client.get_document(doc_id)
+            status = meta.get("status", "")
+            if status == "completed":
+                pending.discard(doc_id)
+            elif status == "failed":
+                raise RuntimeError(f"PageIndex processing failed for doc_id={doc_id}")
+            else:
+                _log.debug("  doc %s status=%s, polling…", doc_id, status)
+        if not pending:
             return
-        if status == "failed":
-            raise RuntimeError(f"PageIndex processing failed for doc_id={doc_id}")
-        _log.debug("  doc %s status=%s, polling…", doc_id, status)
-        time.sleep(interval)
-    raise TimeoutError(f"PageIndex processing timed out after {timeout}s for doc_id={doc_id}")
+        if time.monotonic() >= deadline:
+            raise TimeoutError(
+                f"PageIndex processing timed out after {timeout}s for doc_ids={sorted(pending)}"
+            )
+        time.sleep(delay)
+        delay = min(delay * 2, 10.0)
 
 
-def _run_pageindex(file_path: str) -> tuple[Optional[str], List[Dict[str, Any]], List[str]]:
+def _run_pageindex(
+    file_path: str,
+    client=None,
+    doc_id: Optional[str] = None,
+) -> tuple[Optional[str], List[Dict[str, Any]]]:
     """Submit a PDF to the PageIndex API and retrieve tree + OCR.
 
-    Returns (doc_title, flat_chunks, pages).
+    Pass ``client``/``doc_id`` for documents that were already submitted
+    and polled (batch path).  Returns (doc_title, flat_chunks).
     """
-    client = _get_pageindex_client()
-
-    _log.info("Submitting %s to PageIndex API…", file_path)
-    resp = client.submit_document(file_path)
-    doc_id = resp["doc_id"]
-    _log.info("  doc_id=%s — waiting for processing…", doc_id)
+    if client is None:
+        client = _get_pageindex_client()
 
-    _poll_until_ready(client, doc_id)
+    if doc_id is None:
+        _log.info("Submitting %s to PageIndex API…", file_path)
+        resp = client.submit_document(file_path)
+        doc_id = resp["doc_id"]
+        _log.info("  doc_id=%s — waiting for processing…", doc_id)
+        _poll_until_ready(client, doc_id)
 
     tree_resp = client.get_tree(doc_id)
     ocr_resp = client.get_ocr(doc_id, format="page")
@@ -123,51 +201,74 @@ def _run_pageindex(file_path: str) -> tuple[Optional[str], List[Dict[str, Any]],
     pages = [p.get("text", "") for p in ocr_resp.get("pages", [])]
 
     flat = _flatten_tree(structure, pages, [])
-    return doc_title, flat, pages
+    return doc_title, flat
 
 
 # ── Local Markdown section-aware chunker ─────────────────────────────
 
-import re
 _HEADING_RE = re.compile(r"^(#{1,6})\s+(.*)", re.MULTILINE)
 
+# Emptiness probe: stops at the first non-space char, no stripped copy.
+_HAS_TEXT = re.compile(r"\S").search
 
-def _run_markdown_splitter(file_path: str) -> tuple[Optional[str], List[Dict[str, Any]], List[str]]:
+
+def _run_markdown_splitter(file_path: str) -> tuple[Optional[str], List[Dict[str, Any]]]:
     """Split a Markdown file into chunks along heading boundaries.
 
-    Returns (doc_title, flat_chunks, pages) where pages is the raw lines.
+    Returns (doc_title, flat_chunks); start/end pages are line numbers.
     """
     md_text = Path(file_path).read_text(encoding="utf-8")
-    lines = md_text.split("\n")
-
-    # Build list of (level, title, start_line)
-    headings: list[tuple[int, str, int]] = []
+    # Only the line count is needed up front, not a split line list.
+    last_line = md_text.count("\n")
+
+    # Cheap containment gate: heading-less files skip the regex scan
+    # entirely ('#' in md_text is a single C memchr pass).
+    if "#" not in md_text:
+        return None, [{"text": md_text, "section": "", "start_page": 0, "end_page": last_line, "title": ""}]
+
+    # Build list of (level, title, start_line, char_pos).  Line numbers
+    # are counted incrementally from the previous match — one linear
+    # pass overall instead of a prefix scan per heading.
+    headings: list[tuple[int, str, int, int]] = []
+    last_pos = 0
+    line_no = 0
     for m in _HEADING_RE.finditer(md_text):
         level = len(m.group(1))
         title = m.group(2).strip()
-        line_no = md_text[:m.start()].count("\n")
-        headings.append((level, title, line_no))
+        line_no += md_text.count("\n", last_pos, m.start())
+        last_pos = m.start()
+        headings.append((level, title, line_no, m.start()))
 
     if not headings:
         # No headings — return entire file as one chunk
-        return None, [{"text": md_text, "section": "", "start_page": 0, "end_page": len(lines) - 1, "title": ""}], lines
+        return None, [{"text": md_text, "section": "", "start_page": 0, "end_page": last_line, "title": ""}]
 
     doc_title = headings[0][1] if headings[0][0] == 1 else None
 
-    # Build section spans
+    # Build section spans.  The stack carries the joined breadcrumb so
+    # each heading extends its parent with one concat; interning lets
+    # sibling sections share one string object for the common path.
     flat: List[Dict[str, Any]] = []
-    path_stack: list[tuple[int, str]] = []
+    path_stack: list[tuple[int, str, str]] = []
 
-    for idx, (level, title, start_line) in enumerate(headings):
-        end_line = headings[idx + 1][2] - 1 if idx + 1 < len(headings) else len(lines) - 1
+    for idx, (level, title, start_line, char_pos) in enumerate(headings):
+        if idx + 1 < len(headings):
+            end_line = headings[idx + 1][2] - 1
+            end_pos = headings[idx + 1][3]
+        else:
+            end_line = last_line
+            end_pos = len(md_text)
 
         # Maintain a breadcrumb stack
         while path_stack and path_stack[-1][0] >= level:
             path_stack.pop()
-        path_stack.append((level, title))
-        section = " > ".join(t for _, t in path_stack)
+        parent = path_stack[-1][2] if path_stack else ""
+        section = sys.intern(f"{parent} > {title}" if parent else title)
+        path_stack.append((level, title, section))
 
-        text = "\n".join(lines[start_line:end_line + 1]).strip()
+        # Heading matches anchor at line starts, so the section body is a
+        # direct slice of md_text — no line-list slice + re-join.
+        text = md_text[char_pos:end_pos].strip()
         if not text:
             continue
         flat.append({
@@ -178,11 +279,27 @@ def _run_markdown_splitter(file_path: str) -> tuple[Optional[str], List[Dict[str
             "title": title,
         })
 
-    return doc_title, flat, lines
+    return doc_title, flat
 
 
 # ── Fallback text extraction (used by PageIndex for non-PDF/MD) ──────
 
+# Below this page count, process startup costs more than it saves.
+_PDF_PROCESS_MIN_PAGES = 32
+
+
+def _extract_pdf_page_range(file_path: str, start: int, stop: int) -> List[str]:
+    """Worker: extract text for a page range with its own document handle.
+
+    Module-level so it pickles for ProcessPoolExecutor; PyMuPDF handles
+    cannot be shared across processes.
+    """
+    import fitz
+
+    with fitz.open(file_path) as doc:
+        return [doc[i].get_text() for i in range(start, stop)]
+
+
 def _extract_text_fallback(file_path: str) -> tuple[str, Optional[str]]:
     """Extract raw text from non-PDF/Markdown files."""
     ext = Path(file_path).suffix.lower()
@@ -193,18 +310,50 @@ def _extract_text_fallback(file_path: str) -> tuple[str, Optional[str]]:
         import html2text
 
         book = epub.read_epub(file_path)
-        h = html2text.HTML2Text()
-        h.ignore_links = False
-        parts = []
-        for item in book.get_items_of_type(ebooklib.ITEM_DOCUMENT):
-            parts.append(h.handle(item.get_content().decode("utf-8", errors="replace")))
+
+        def _item_to_text(item) -> str:
+            # HTML2Text keeps parse state, so each worker gets its own.
+            h = html2text.HTML2Text()
+            h.ignore_links = False
+            return h.handle(item.get_content().decode("utf-8", errors="replace"))
+
+        items = list(book.get_items_of_type(ebooklib.ITEM_DOCUMENT))
+        if len(items) > 1:
+            with ThreadPoolExecutor(max_workers=_HASH_WORKERS) as pool:
+                parts = list(pool.map(_item_to_text, items))
+        else:
+            parts = [_item_to_text(item) for item in items]
         return "\n\n".join(parts), "application/epub+zip"
 
     try:
         import fitz  # PyMuPDF
-        doc = fitz.open(file_path)
-        pages = [page.get_text() for page in doc]
-        doc.close()
+        # One Document for the whole file; page text is pulled in a single
+        # pass. PyMuPDF documents are not thread-safe, so pages of the
+        # same handle must not be read from multiple threads.
+        with fitz.open(file_path) as doc:
+            page_count = doc.page_count
+            if page_count < _PDF_PROCESS_MIN_PAGES:
+                return "\n\n".join(page.get_text() for page in doc), None
+
+        # Large PDF: MuPDF's layout analysis is CPU-bound, so fan page
+        # ranges out to worker processes (the handle above is closed
+        # first — each worker opens the file itself).  If the pool
+        # can't run here (daemonic parent, sandboxed deploy, broken
+        # workers), fall back to a sequential pass instead of letting
+        # the raw-bytes read below mangle the PDF.
+        workers = min(os.cpu_count() or 1, 4)
+        span = -(-page_count // workers)
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(_extract_pdf_page_range, file_path, s, min(s + span, page_count))
+                    for s in range(0, page_count, span)
+                ]
+                pages = [text for fut in futures for text in fut.result()]
+        except Exception as e:
+            _log.info("PDF worker pool unavailable (%s); extracting sequentially", e)
+            with fitz.open(file_path) as doc:
+                pages = [page.get_text() for page in doc]
         return "\n\n".join(pages), None
     except Exception:
         pass
@@ -212,90 +361,138 @@ def _extract_text_fallback(file_path: str) -> tuple[str, Optional[str]]:
     return Path(file_path).read_text(encoding="utf-8", errors="replace"), None
 
 
-def _chunk_text(text: str, chunk_size: int = 3000, overlap: int = 200) -> List[str]:
-    """Split text into overlapping chunks by character count."""
-    chunks = []
+def _chunk_text(text: str, chunk_size: int = 3000, overlap: int = 200) -> Iterator[str]:
+    """Yield overlapping chunks of text by character count.
+
+    Chunk ends snap back to the nearest newline (or space) so windows
+    don't cut words or sentences mid-way; the search is bounded to the
+    tail past the minimum step, so progress is always ≥ step - overlap.
+    A generator so only one window copy is alive at a time while the
+    caller builds its DTO.
+    """
+    step = chunk_size - overlap
+    n = len(text)
     start = 0
-    while start < len(text):
+    while start < n:
         end = start + chunk_size
-        chunks.append(text[start:end])
+        if end < n:
+            cut = text.rfind("\n", start + step, end)
+            if cut == -1:
+                cut = text.rfind(" ", start + step, end)
+            if cut != -1:
+                end = cut + 1
+        yield text[start:end]
+        if end >= n:
+            return
         start = end - overlap
+
+
+# Fan hashing out to threads only when there is enough work to amortize
+# the pool startup; hashlib releases the GIL on large buffers.
+_HASH_WORKERS = 4
+_HASH_PARALLEL_MIN = 16
+
+
+def _hash_texts(texts: List[str]) -> List[str]:
+    if len(texts) >= _HASH_PARALLEL_MIN:
+        with ThreadPoolExecutor(max_workers=_HASH_WORKERS) as pool:
+            return list(pool.map(hash_text, texts))
+    return [hash_text(t) for t in texts]
+
+
+def _build_chunks(
+    doc_id: str,
+    file_path: str,
+    mime: Optional[str],
+    flat_chunks: List[Dict[str, Any]],
+) -> List[ChunkDTO]:
+    """Turn flattened section chunks into ChunkDTOs with provenance."""
+    texts = [fc["text"] for fc in flat_chunks]
+    hashes = _hash_texts(texts)
+    snippets = list(map(clean_snippet, texts))
+    created_at = utc_now_iso()  # one timestamp for the whole batch
+
+    chunks: List[ChunkDTO] = []
+    for i, fc in enumerate(flat_chunks):
+        text = texts[i]
+        section = fc.get("section")
+        start_page = fc.get("start_page")
+        # All values here are produced by our own splitters with known
+        # types, so skip Pydantic validation in this hot loop.
+        prov = ProvenanceDTO.model_construct(
+            source_path=file_path, source_mime=mime,
+            page=start_page,
+            page_label=str(start_page) if start_page is not None else None,
+            section=section, text_snippet=snippets[i], raw=fc,
+        )
+        chunk = ChunkDTO.model_construct(
+            document_id=doc_id,
+            chunk_id=stable_chunk_id(doc_id, i, start_page),
+            chunk_index=i, text=text, provenance=prov,
+            text_hash=hashes[i],
+            created_at=created_at,
+        )
+        chunks.append(chunk)
+        _log.debug("  chunk %d: id=%s len=%d section=%s", i, chunk.chunk_id, len(text), section)
     return chunks
 
 
-def extract_with_pageindex(file_path: str, mime: Optional[str] = None) -> DocumentDTO:
+def extract_with_pageindex(
+    file_path: str,
+    mime: Optional[str] = None,
+    _client=None,
+    _doc_id: Optional[str] = None,
+) -> DocumentDTO:
     """Ingest using PageIndex (hierarchical) + fallback for non-PDF/MD."""
-    content_hash = hash_file(file_path)
-    doc_id = stable_document_id(file_path)
     ext = Path(file_path).suffix.lower()
+    splitter = _EXT_SPLITTER.get(ext)
+
+    _log.info("Ingesting %s [engine=pageindex]", file_path)
+
+    # Hash in a worker thread so the digest overlaps the PageIndex
+    # upload + remote processing wait (or the local split) instead of
+    # delaying it; hashlib releases the GIL while digesting.
+    flat_chunks: Optional[List[Dict[str, Any]]] = None
+    doc_title: Optional[str] = None
+    full_text = ""
+    detected_mime: Optional[str] = None
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        hash_fut = pool.submit(hash_file, file_path)
+
+        if splitter == "markdown":
+            _log.info("Using local Markdown splitter for %s", ext)
+            doc_title, flat_chunks = _run_markdown_splitter(file_path)
+        elif splitter == "pageindex":
+            _log.info("Using PageIndex API for %s", ext)
+            doc_title, flat_chunks = _run_pageindex(file_path, client=_client, doc_id=_doc_id)
+        else:
+            _log.info("Fallback text extraction for %s", ext)
+            full_text, detected_mime = _extract_text_fallback(file_path)
+
+        content_hash = hash_fut.result()
 
-    _log.info("Ingesting %s [engine=pageindex] (doc_id=%s, hash=%s)", file_path, doc_id, content_hash[:12])
+    doc_id = stable_document_id(file_path, content_hash)
+    _log.info("  doc_id=%s hash=%s", doc_id, content_hash[:12])
 
     out = DocumentDTO(
         document_id=doc_id, source_path=file_path,
         source_mime=mime, content_hash=content_hash, title=None, chunks=[],
     )
 
-    if ext in _MARKDOWN_EXTS:
-        _log.info("Using local Markdown splitter for %s", ext)
-        doc_title, flat_chunks, _pages = _run_markdown_splitter(file_path)
-        out.title = doc_title
-
-        for i, fc in enumerate(flat_chunks):
-            text = fc["text"]
-            section = fc.get("section")
-            start_page = fc.get("start_page")
-            prov = ProvenanceDTO(
-                source_path=file_path, source_mime=mime,
-                page=start_page,
-                page_label=str(start_page) if start_page is not None else None,
-                section=section, text_snippet=clean_snippet(text), raw=fc,
-            )
-            chunk = ChunkDTO(
-                document_id=doc_id,
-                chunk_id=stable_chunk_id(doc_id, i, start_page),
-                chunk_index=i, text=text, provenance=prov,
-                text_hash=hash_text(text),
-            )
-            out.chunks.append(chunk)
-            _log.debug("  chunk %d: id=%s len=%d section=%s", i, chunk.chunk_id, len(text), section)
-
-    elif ext in _PAGEINDEX_EXTS:
-        _log.info("Using PageIndex API for %s", ext)
-        doc_title, flat_chunks, _pages = _run_pageindex(file_path)
+    if flat_chunks is not None:
         out.title = doc_title
-
-        for i, fc in enumerate(flat_chunks):
-            text = fc["text"]
-            section = fc.get("section")
-            start_page = fc.get("start_page")
-            prov = ProvenanceDTO(
-                source_path=file_path, source_mime=mime,
-                page=start_page,
-                page_label=str(start_page) if start_page is not None else None,
-                section=section, text_snippet=clean_snippet(text), raw=fc,
-            )
-            chunk = ChunkDTO(
-                document_id=doc_id,
-                chunk_id=stable_chunk_id(doc_id, i, start_page),
-                chunk_index=i, text=text, provenance=prov,
-                text_hash=hash_text(text),
-            )
-            out.chunks.append(chunk)
-            _log.debug("  chunk %d: id=%s len=%d section=%s", i, chunk.chunk_id, len(text), section)
+        out.chunks = _build_chunks(doc_id, file_path, mime, flat_chunks)
     else:
-        _log.info("Fallback text extraction for %s", ext)
-        full_text, detected_mime = _extract_text_fallback(file_path)
         if detected_mime and not mime:
             out.source_mime = detected_mime
         for i, text in enumerate(_chunk_text(full_text)):
-            if not text.strip():
+            if not _HAS_TEXT(text):
                 continue
-            prov = ProvenanceDTO(
+            prov = ProvenanceDTO.model_construct(
                 source_path=file_path, source_mime=mime or detected_mime,
                 text_snippet=clean_snippet(text),
             )
-            chunk = ChunkDTO(
+            chunk = ChunkDTO.model_construct(
                 document_id=doc_id,
                 chunk_id=stable_chunk_id(doc_id, i, None),
                 chunk_index=i, text=text, provenance=prov,
@@ -307,6 +504,36 @@ def extract_with_pageindex(file_path: str, mime: Optional[str] = None) -> Docume
     return out
 
 
+def extract_with_pageindex_batch(
+    file_paths: List[str],
+    mime: Optional[str] = None,
+    max_workers: int = 8,
+) -> List[DocumentDTO]:
+    """Ingest several files with the PageIndex engine.
+
+    PDFs are submitted concurrently up front and polled together, so the
+    corpus waits roughly one PageIndex processing time instead of paying
+    submit + poll latency per document.  Non-PDF files go through the
+    usual local splitter / fallback paths.
+    """
+    pdfs = [p for p in file_paths if Path(p).suffix.lower() in _PAGEINDEX_EXTS]
+
+    client = None
+    submitted: Dict[str, str] = {}
+    if pdfs:
+        client = _get_pageindex_client()
+        _log.info("Submitting %d PDFs to PageIndex API…", len(pdfs))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            doc_ids = list(pool.map(lambda p: client.submit_document(p)["doc_id"], pdfs))
+        submitted = dict(zip(pdfs, doc_ids))
+        _poll_many_until_ready(client, doc_ids)
+
+    return [
+        extract_with_pageindex(p, mime=mime, _client=client, _doc_id=submitted.get(p))
+        for p in file_paths
+    ]
+
+
 # =====================================================================
 #  LlamaIndex engine
 # =====================================================================
@@ -317,7 +544,7 @@ def extract_with_llamaindex(file_path: str, mime: Optional[str] = None) -> Docum
     from llama_index.core.node_parser import SentenceSplitter
 
     content_hash = hash_file(file_path)
-    doc_id = stable_document_id(file_path)
+    doc_id = stable_document_id(file_path, content_hash)
 
     _log.info("Ingesting %s [engine=llamaindex] (doc_id=%s, hash=%s)", file_path, doc_id, content_hash[:12])
 
@@ -388,3 +615,28 @@ def extract_document(
     if fn is None:
         raise ValueError(f"Unknown engine {engine!r}. Choose from: {', '.join(ENGINES)}")
     return fn(file_path, mime=mime)
+
+
+def extract_documents(
+    file_paths: List[str],
+    mime: Optional[str] = None,
+    engine: str = "llamaindex",
+    max_workers: Optional[int] = None,
+) -> List[DocumentDTO]:
+    """Ingest several documents concurrently with the selected engine.
+
+    Per-file work is dominated by network waits (PageIndex API) or
+    GIL-releasing C extensions (PyMuPDF, hashlib), so threads overlap it
+    well.  The pageindex engine defaults to more workers since its time
+    is almost pure API wait.
+    """
+    if max_workers is None:
+        max_workers = 16 if engine == "pageindex" else 4
+
+    paths = list(file_paths)
+    if len(paths) <= 1:
+        return [extract_document(p, mime=mime, engine=engine) for p in paths]
+
+    _log.info("Ingesting %d documents [engine=%s, workers=%d]", len(paths), engine, max_workers)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(lambda p: extract_document(p, mime=mime, engine=engine), paths))
@@ -9,13 +9,17 @@ OntoRAG Hub — web API that orchestrates the pipeline.
 """
 from __future__ import annotations
 
+import asyncio
+import functools
 import hashlib
-import json
 import os
 import tempfile
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import orjson
 from dotenv import load_dotenv
 load_dotenv()
 
@@ -26,18 +30,25 @@ from fastapi.responses import RedirectResponse
 from ontorag.hub.auth import (
     GITHUB_CLIENT_ID,
     CurrentUser,
+    close_http_client as close_auth_client,
     create_session_token,
     github_exchange_code,
     github_get_user,
     require_user,
 )
+from ontorag.openrouter import close_http_client as close_llm_client
 from ontorag.hub.github_storage import (
+    close_http_client as close_storage_client,
     ensure_repo,
     file_exists,
+    list_dir,
     read_file,
     write_file,
+    write_files_batch,
 )
 from ontorag.hub.models import (
+    ExtractAllRequest,
+    ExtractAllResult,
     ExtractInstancesRequest,
     ExtractInstancesResult,
     ExtractSchemaRequest,
@@ -56,6 +67,15 @@ _log = get_logger("ontorag.hub.app")
 
 # ── App ──────────────────────────────────────────────────────────────
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Drain the shared keep-alive pools on shutdown.
+    await close_storage_client()
+    await close_auth_client()
+    await close_llm_client()
+
+
 app = FastAPI(
     title="OntoRAG Hub",
     version="0.1.0",
@@ -63,6 +83,7 @@ app = FastAPI(
         "GitHub-authenticated API for the OntoRAG pipeline.  "
         "User data lives in private GitHub repos; ontologies are centrally shared."
     ),
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -77,6 +98,37 @@ app.add_middleware(
 _ONTOLOGY_DIR = Path(os.getenv("HUB_ONTOLOGY_DIR", "./data/hub_ontologies"))
 
 
+@functools.lru_cache(maxsize=128)
+def _load_card_cached(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    return orjson.loads(Path(path_str).read_bytes())
+
+
+def _load_schema_card(card_path: Path) -> Optional[Dict[str, Any]]:
+    """Parsed schema card for a registry path, or None if missing.
+
+    Cached by (path, mtime) — popular ontologies are requested far more
+    often than they change.  Callers must treat the dict as read-only.
+    """
+    try:
+        st = card_path.stat()
+    except FileNotFoundError:
+        return None
+    return _load_card_cached(str(card_path), st.st_mtime_ns)
+
+
+def _iter_jsonl(raw: bytes):
+    """Yield parsed objects from a JSONL byte blob.
+
+    Only lines whose last byte closes a JSON value are parsed — blanks
+    and a possibly truncated trailing line are skipped without a
+    per-line strip() copy or a full-buffer decode up front.
+    """
+    loads = orjson.loads
+    for ln in raw.splitlines():
+        if ln.endswith((b"}", b"]")):
+            yield loads(ln)
+
+
 # =====================================================================
 #  Auth routes
 # =====================================================================
@@ -128,6 +180,19 @@ def health():
 #  Ingest — upload file, hash, chunk, store to user's repo
 # =====================================================================
 
+# Content hashes known to exist in a user repo — spares the GitHub HEAD
+# round-trip on idempotent re-uploads.  Only positive results are
+# cached (best-effort per worker); force=true bypasses it.
+_ingest_seen: Dict[tuple[str, str], bool] = {}
+_INGEST_SEEN_MAX = 4096
+
+
+def _mark_ingested(repo: str, content_hash: str) -> None:
+    if len(_ingest_seen) >= _INGEST_SEEN_MAX:
+        _ingest_seen.clear()
+    _ingest_seen[(repo, content_hash)] = True
+
+
 @app.post("/api/ingest", response_model=IngestResult)
 async def api_ingest(
     file: UploadFile = File(...),
@@ -139,17 +204,31 @@ async def api_ingest(
     Upload a document, content-hash it, chunk it, and store the DTOs
     in the user's private ``ontorag-data`` GitHub repo.
     """
-    raw = await file.read()
-    content_hash = hashlib.sha256(raw).hexdigest()
+    # Stream the upload to a temp file, hashing in the same pass — the
+    # body is never held in memory, so multi-GB uploads stay O(block).
+    # The extractor works on the temp file afterwards.
+    h = hashlib.sha256()
+    suffix = Path(file.filename or "upload").suffix
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+        while block := await file.read(1 << 20):
+            h.update(block)
+            tmp.write(block)
+        tmp_path = tmp.name
+    content_hash = h.hexdigest()
     doc_id = f"doc_{content_hash[:16]}"
 
     repo = await ensure_repo(user.gh_token, user.login)
     doc_path = f"data/dto/documents/{doc_id}.json"
 
-    # Dedup check
-    if not force and await file_exists(user.gh_token, repo, doc_path):
+    # Dedup check — local cache first, then GitHub
+    if not force and (
+        (repo, content_hash) in _ingest_seen
+        or await file_exists(user.gh_token, repo, doc_path)
+    ):
+        _mark_ingested(repo, content_hash)
+        Path(tmp_path).unlink(missing_ok=True)
         _log.info("SKIP ingest for %s: %s already exists", user.login, doc_id)
-        return IngestResult(
+        return IngestResult.model_construct(
             document_id=doc_id,
             content_hash=content_hash,
             chunks=0,
@@ -157,46 +236,48 @@ async def api_ingest(
             skipped=True,
         )
 
-    # Write to a temp file so the existing extractor can work on it
-    suffix = Path(file.filename or "upload").suffix
-    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-        tmp.write(raw)
-        tmp_path = tmp.name
-
     try:
         from ontorag.extractor_ingest import extract_document
 
-        doc = extract_document(tmp_path, mime=file.content_type, engine=engine)
+        # Extraction is blocking (PyMuPDF, hashing, PageIndex polling) —
+        # run it in a worker thread so the event loop keeps serving.
+        doc = await asyncio.to_thread(
+            extract_document, tmp_path, mime=file.content_type, engine=engine
+        )
         # Override the document_id to match our content-hash based one
         doc.document_id = doc_id
         doc.content_hash = content_hash
         doc.source_path = file.filename or "upload"
-        for i, chunk in enumerate(doc.chunks):
-            chunk.document_id = doc_id
     finally:
         Path(tmp_path).unlink(missing_ok=True)
 
-    # Serialize and push to user's GitHub repo
-    doc_meta = doc.model_dump()
+    # Serialize and push to user's GitHub repo.  Excluding chunks here
+    # avoids dumping every chunk into doc_meta just to discard them.
+    doc_meta = doc.model_dump(exclude={"chunks"})
     doc_meta["chunks"] = []
-    await write_file(
-        user.gh_token, repo, doc_path,
-        json.dumps(doc_meta, ensure_ascii=False, indent=2),
+    # Append-only buffer: one growing allocation instead of a list of
+    # line strings plus a second full-size join copy.  The id rewrite
+    # is fused into the same pass, with dumps hoisted to a local.
+    buf = bytearray()
+    dumps = orjson.dumps
+    for ch in doc.chunks:
+        ch.document_id = doc_id
+        buf += dumps(ch.model_dump())
+        buf += b"\n"
+    # One commit for both artifacts — blobs + tree + commit instead of
+    # a GET-for-SHA + PUT round-trip pair per file.
+    await write_files_batch(
+        user.gh_token, repo,
+        [
+            (doc_path, orjson.dumps(doc_meta, option=orjson.OPT_INDENT_2)),
+            (f"data/dto/chunks/{doc_id}.jsonl", bytes(buf)),
+        ],
         message=f"ontorag-hub: ingest {doc_id}",
     )
 
-    chunks_lines = [
-        json.dumps(ch.model_dump(), ensure_ascii=False)
-        for ch in doc.chunks
-    ]
-    await write_file(
-        user.gh_token, repo, f"data/dto/chunks/{doc_id}.jsonl",
-        "\n".join(chunks_lines) + "\n",
-        message=f"ontorag-hub: chunks for {doc_id}",
-    )
-
+    _mark_ingested(repo, content_hash)
     _log.info("Ingested %s for %s: %d chunks -> %s", doc_id, user.login, len(doc.chunks), repo)
-    return IngestResult(
+    return IngestResult.model_construct(
         document_id=doc_id,
         content_hash=content_hash,
         chunks=len(doc.chunks),
@@ -224,29 +305,29 @@ async def api_extract_schema(
     if chunks_raw is None:
         raise HTTPException(status_code=404, detail=f"Chunks not found: {body.document_id}")
 
-    chunks_list = [json.loads(line) for line in chunks_raw.strip().splitlines() if line.strip()]
+    chunks_list = list(_iter_jsonl(chunks_raw))
 
     # Load schema card: from central store if slug provided, else empty
     card: Dict[str, Any] = {"classes": [], "datatype_properties": [], "object_properties": []}
     if body.schema_card_slug:
-        card_path = _ONTOLOGY_DIR / body.schema_card_slug / "schema_card.json"
-        if card_path.exists():
-            card = json.loads(card_path.read_text(encoding="utf-8"))
+        loaded = _load_schema_card(_ONTOLOGY_DIR / body.schema_card_slug / "schema_card.json")
+        if loaded is not None:
+            card = loaded
 
-    from ontorag.ontology_extractor_openrouter import extract_schema_chunk_proposals
+    from ontorag.ontology_extractor_openrouter import extract_schema_chunk_proposals_async
     from ontorag.proposal_aggregator import aggregate_chunk_proposals
 
-    chunk_proposals = extract_schema_chunk_proposals(chunks_list, card)
+    chunk_proposals = await extract_schema_chunk_proposals_async(chunks_list, card)
     aggregated = aggregate_chunk_proposals(chunk_proposals)
 
     proposal_path = f"data/proposals/{body.document_id}.schema.json"
     await write_file(
         user.gh_token, repo, proposal_path,
-        json.dumps(aggregated, ensure_ascii=False, indent=2),
+        orjson.dumps(aggregated, option=orjson.OPT_INDENT_2),
         message=f"ontorag-hub: schema proposal for {body.document_id}",
     )
 
-    return ExtractSchemaResult(
+    return ExtractSchemaResult.model_construct(
         document_id=body.document_id,
         proposal_path=proposal_path,
         classes_proposed=len(aggregated.get("classes", [])),
@@ -276,21 +357,27 @@ async def api_extract_instances(
     if chunks_raw is None:
         raise HTTPException(status_code=404, detail=f"Chunks not found: {body.document_id}")
 
-    chunks_list = [json.loads(line) for line in chunks_raw.strip().splitlines() if line.strip()]
-    chunks_by_id = {c.get("chunk_id"): c for c in chunks_list if c.get("chunk_id")}
-
-    card_path = _ONTOLOGY_DIR / body.schema_card_slug / "schema_card.json"
-    if not card_path.exists():
+    # Single pass: collect the list and the chunk_id index together.
+    chunks_list: List[Dict[str, Any]] = []
+    chunks_by_id: Dict[str, Dict[str, Any]] = {}
+    for c in _iter_jsonl(chunks_raw):
+        chunks_list.append(c)
+        cid = c.get("chunk_id")
+        if cid:
+            chunks_by_id[cid] = c
+
+    card = _load_schema_card(_ONTOLOGY_DIR / body.schema_card_slug / "schema_card.json")
+    if card is None:
         raise HTTPException(status_code=404, detail=f"Ontology not found: {body.schema_card_slug}")
-    card = json.loads(card_path.read_text(encoding="utf-8"))
 
-    from ontorag.instance_extractor_openrouter import extract_instance_chunk_proposals
+    from ontorag.instance_extractor_openrouter import extract_instance_chunk_proposals_async
     from ontorag.instances_to_ttl import instance_proposals_to_graph
 
-    proposals = extract_instance_chunk_proposals(chunks_list, card)
+    proposals = await extract_instance_chunk_proposals_async(chunks_list, card)
     ns = card.get("namespace", "http://www.example.com/biz/")
     g = instance_proposals_to_graph(chunks_by_id, proposals, namespace=ns)
-    ttl_content = g.serialize(format="turtle")
+    # Turtle serialization is pure CPU on a potentially large graph.
+    ttl_content = await asyncio.to_thread(g.serialize, format="turtle")
 
     instances_path = f"data/instances/{body.document_id}.instances.ttl"
     await write_file(
@@ -299,27 +386,121 @@ async def api_extract_instances(
         message=f"ontorag-hub: instances for {body.document_id}",
     )
 
-    return ExtractInstancesResult(
+    return ExtractInstancesResult.model_construct(
         document_id=body.document_id,
         instances_path=instances_path,
         triples=len(g),
     )
 
 
+# =====================================================================
+#  Combined extraction — schema + instances in one call
+# =====================================================================
+
+@app.post("/api/extract-all", response_model=ExtractAllResult)
+async def api_extract_all(
+    body: ExtractAllRequest,
+    user: CurrentUser = Depends(require_user),
+):
+    """
+    Run schema induction and instance extraction together.
+
+    Both phases are LLM-bound over the same chunk set and independent,
+    so they run concurrently; the chunks JSONL is fetched and parsed
+    exactly once and shared read-only between the two coroutines.
+    """
+    repo = await ensure_repo(user.gh_token, user.login)
+    chunks_path = f"data/dto/chunks/{body.document_id}.jsonl"
+
+    chunks_raw = await read_file(user.gh_token, repo, chunks_path)
+    if chunks_raw is None:
+        raise HTTPException(status_code=404, detail=f"Chunks not found: {body.document_id}")
+
+    chunks_list: List[Dict[str, Any]] = []
+    chunks_by_id: Dict[str, Dict[str, Any]] = {}
+    for c in _iter_jsonl(chunks_raw):
+        chunks_list.append(c)
+        cid = c.get("chunk_id")
+        if cid:
+            chunks_by_id[cid] = c
+
+    card = _load_schema_card(_ONTOLOGY_DIR / body.schema_card_slug / "schema_card.json")
+    if card is None:
+        raise HTTPException(status_code=404, detail=f"Ontology not found: {body.schema_card_slug}")
+
+    from ontorag.instance_extractor_openrouter import extract_instance_chunk_proposals_async
+    from ontorag.instances_to_ttl import instance_proposals_to_graph
+    from ontorag.ontology_extractor_openrouter import extract_schema_chunk_proposals_async
+    from ontorag.proposal_aggregator import aggregate_chunk_proposals
+
+    chunk_proposals, instance_proposals = await asyncio.gather(
+        extract_schema_chunk_proposals_async(chunks_list, card),
+        extract_instance_chunk_proposals_async(chunks_list, card),
+    )
+
+    aggregated = aggregate_chunk_proposals(chunk_proposals)
+    ns = card.get("namespace", "http://www.example.com/biz/")
+    g = instance_proposals_to_graph(chunks_by_id, instance_proposals, namespace=ns)
+    # Turtle serialization is pure CPU on a potentially large graph.
+    ttl_content = await asyncio.to_thread(g.serialize, format="turtle")
+
+    proposal_path = f"data/proposals/{body.document_id}.schema.json"
+    instances_path = f"data/instances/{body.document_id}.instances.ttl"
+    await write_files_batch(
+        user.gh_token, repo,
+        [
+            (proposal_path, orjson.dumps(aggregated, option=orjson.OPT_INDENT_2)),
+            (instances_path, ttl_content),
+        ],
+        message=f"ontorag-hub: schema + instances for {body.document_id}",
+    )
+
+    return ExtractAllResult.model_construct(
+        document_id=body.document_id,
+        schema_result=ExtractSchemaResult.model_construct(
+            document_id=body.document_id,
+            proposal_path=proposal_path,
+            classes_proposed=len(aggregated.get("classes", [])),
+            properties_proposed=(
+                len(aggregated.get("datatype_properties", []))
+                + len(aggregated.get("object_properties", []))
+            ),
+        ),
+        instances_result=ExtractInstancesResult.model_construct(
+            document_id=body.document_id,
+            instances_path=instances_path,
+            triples=len(g),
+        ),
+    )
+
+
 # =====================================================================
 #  Central ontology registry
 # =====================================================================
 
+# Registry listing cache: the directory scan + meta parses are repeated
+# verbatim between publishes, so a short TTL absorbs nearly all of them.
+_ONTOLOGY_LIST_TTL = 5.0
+_ontology_list_cache: Optional[tuple[float, List[OntologySummary]]] = None
+
+
 @app.get("/api/ontologies", response_model=List[OntologySummary])
 async def api_list_ontologies():
     """List all centrally registered ontologies."""
+    global _ontology_list_cache
+    now = time.monotonic()
+    if _ontology_list_cache is not None and now - _ontology_list_cache[0] < _ONTOLOGY_LIST_TTL:
+        return _ontology_list_cache[1]
+
     _ONTOLOGY_DIR.mkdir(parents=True, exist_ok=True)
     results: List[OntologySummary] = []
     for entry in sorted(_ONTOLOGY_DIR.iterdir()):
         meta_path = entry / "meta.json"
         if meta_path.exists():
-            meta = json.loads(meta_path.read_text(encoding="utf-8"))
-            results.append(OntologySummary(**meta))
+            meta = orjson.loads(meta_path.read_bytes())
+            results.append(OntologySummary.model_construct(**meta))
+
+    _ontology_list_cache = (now, results)
     return results
 
 
@@ -338,8 +519,8 @@ async def api_publish_ontology(
     slug_dir.mkdir(parents=True, exist_ok=True)
 
     card = body.schema_card
-    (slug_dir / "schema_card.json").write_text(
-        json.dumps(card, ensure_ascii=False, indent=2), encoding="utf-8"
+    (slug_dir / "schema_card.json").write_bytes(
+        orjson.dumps(card, option=orjson.OPT_INDENT_2)
     )
 
     meta = OntologySummary(
@@ -359,6 +540,9 @@ async def api_publish_ontology(
         meta.model_dump_json(indent=2), encoding="utf-8"
     )
 
+    global _ontology_list_cache
+    _ontology_list_cache = None
+
     _log.info("Published ontology %s by %s", body.slug, user.login)
     return meta
 
@@ -366,10 +550,10 @@ async def api_publish_ontology(
 @app.get("/api/ontologies/{slug}", response_model=Dict[str, Any])
 async def api_get_ontology(slug: str):
     """Return the full schema card for a registered ontology."""
-    card_path = _ONTOLOGY_DIR / slug / "schema_card.json"
-    if not card_path.exists():
+    card = _load_schema_card(_ONTOLOGY_DIR / slug / "schema_card.json")
+    if card is None:
         raise HTTPException(status_code=404, detail=f"Ontology not found: {slug}")
-    return json.loads(card_path.read_text(encoding="utf-8"))
+    return card
 
 
 # =====================================================================
@@ -392,7 +576,7 @@ async def api_mcp_endpoint(slug: str):
     # In production this would point to a dynamically provisioned MCP
     # server.  For now we return the expected endpoint shape.
     base_url = os.getenv("HUB_BASE_URL", "http://localhost:9010")
-    return McpEndpoint(
+    return McpEndpoint.model_construct(
         slug=slug,
         url=f"{base_url}/mcp/{slug}/sse",
         tools=[
@@ -413,23 +597,10 @@ async def api_mcp_endpoint(slug: str):
 @app.get("/api/documents")
 async def api_list_documents(user: CurrentUser = Depends(require_user)):
     """List documents ingested by the authenticated user."""
-    import httpx
-
     repo = f"{user.login}/ontorag-data"
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(
-            f"https://api.github.com/repos/{repo}/contents/data/dto/documents",
-            headers={
-                "Authorization": f"Bearer {user.gh_token}",
-                "Accept": "application/vnd.github+json",
-            },
-        )
-    if resp.status_code == 404:
-        return []
-    resp.raise_for_status()
-    files = resp.json()
+    names = await list_dir(user.gh_token, repo, "data/dto/documents")
     return [
-        {"document_id": f["name"].replace(".json", ""), "path": f["path"]}
-        for f in files
-        if f["name"].endswith(".json")
+        {"document_id": name[:-5], "path": f"data/dto/documents/{name}"}
+        for name in names
+        if name.endswith(".json")
     ]
@@ -33,25 +33,40 @@ JWT_SECRET = os.getenv("HUB_JWT_SECRET", "change-me-in-production")
 JWT_ALGORITHM = os.getenv("HUB_JWT_ALGORITHM", "HS256")
 JWT_EXPIRY_HOURS = int(os.getenv("HUB_JWT_EXPIRY_HOURS", "24"))
 
+# Reused decoder state — the jwt.decode convenience wrapper rebuilds
+# its options dict and algorithm list on every call, and this runs once
+# per authenticated request.
+_jwt = jwt.PyJWT()
+_JWT_ALGORITHMS = [JWT_ALGORITHM]
+_JWT_OPTIONS = {"require": ["exp", "sub"]}
+
 _bearer = HTTPBearer(auto_error=False)
 
+# Shared pooled client for OAuth + profile calls — keep-alive instead
+# of a TLS handshake per login step.
+_client = httpx.AsyncClient(timeout=30.0)
+
+
+async def close_http_client() -> None:
+    """Close the shared OAuth client (call on app shutdown)."""
+    await _client.aclose()
+
 
 # ── GitHub OAuth exchange ────────────────────────────────────────────
 
 async def github_exchange_code(code: str) -> str:
     """Exchange an OAuth authorization code for a GitHub access token."""
-    async with httpx.AsyncClient() as client:
-        resp = await client.post(
-            "https://github.com/login/oauth/access_token",
-            json={
-                "client_id": GITHUB_CLIENT_ID,
-                "client_secret": GITHUB_CLIENT_SECRET,
-                "code": code,
-            },
-            headers={"Accept": "application/json"},
-        )
-        resp.raise_for_status()
-        data = resp.json()
+    resp = await _client.post(
+        "https://github.com/login/oauth/access_token",
+        json={
+            "client_id": GITHUB_CLIENT_ID,
+            "client_secret": GITHUB_CLIENT_SECRET,
+            "code": code,
+        },
+        headers={"Accept": "application/json"},
+    )
+    resp.raise_for_status()
+    data = resp.json()
 
     token = data.get("access_token")
     if not token:
@@ -62,13 +77,12 @@ async def github_exchange_code(code: str) -> str:
 
 async def github_get_user(gh_token: str) -> GitHubUser:
     """Fetch the authenticated GitHub user profile."""
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(
-            "https://api.github.com/user",
-            headers={"Authorization": f"Bearer {gh_token}", "Accept": "application/json"},
-        )
-        resp.raise_for_status()
-        data = resp.json()
+    resp = await _client.get(
+        "https://api.github.com/user",
+        headers={"Authorization": f"Bearer {gh_token}", "Accept": "application/json"},
+    )
+    resp.raise_for_status()
+    data = resp.json()
 
     return GitHubUser(
         login=data["login"],
@@ -97,7 +111,7 @@ def create_session_token(user: GitHubUser, gh_token: str) -> str:
 def decode_session_token(token: str) -> dict:
     """Decode and verify a session JWT.  Raises HTTPException on failure."""
     try:
-        return jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        return _jwt.decode(token, JWT_SECRET, algorithms=_JWT_ALGORITHMS, options=_JWT_OPTIONS)
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Session expired")
     except jwt.InvalidTokenError as exc:
@@ -14,6 +14,7 @@ Layout inside the repo:
 """
 from __future__ import annotations
 
+import asyncio
 import base64
 from typing import Optional
 
@@ -28,6 +29,20 @@ REPO_DESCRIPTION = "OntoRAG Hub — private pipeline artifacts (auto-managed)"
 
 _API = "https://api.github.com"
 
+# One pooled client for all GitHub API calls: keep-alive skips the TLS
+# handshake per request, and HTTP/2 multiplexes concurrent blob uploads
+# over a single connection.
+_client = httpx.AsyncClient(
+    http2=True,
+    timeout=30.0,
+    limits=httpx.Limits(max_keepalive_connections=50),
+)
+
+
+async def close_http_client() -> None:
+    """Close the shared GitHub API client (call on app shutdown)."""
+    await _client.aclose()
+
 
 def _headers(gh_token: str) -> dict:
     return {
@@ -39,30 +54,57 @@ def _headers(gh_token: str) -> dict:
 
 # ── Repo lifecycle ───────────────────────────────────────────────────
 
+# Default branch per repo, seeded from the repo GET/create responses in
+# ensure_repo so batch writes don't pay an extra round-trip for it.
+_branch_cache: dict[str, str] = {}
+_BRANCH_CACHE_MAX = 4096
+
+
+def _remember_branch(repo: str, branch: Optional[str]) -> None:
+    if not branch:
+        return
+    if len(_branch_cache) >= _BRANCH_CACHE_MAX:
+        _branch_cache.clear()
+    _branch_cache[repo] = branch
+
+
+async def _default_branch(gh_token: str, repo: str) -> str:
+    """Resolve the repo's default branch (``main``, ``master``, ...)."""
+    branch = _branch_cache.get(repo)
+    if branch:
+        return branch
+    resp = await _client.get(f"{_API}/repos/{repo}", headers=_headers(gh_token))
+    resp.raise_for_status()
+    branch = resp.json().get("default_branch") or "main"
+    _remember_branch(repo, branch)
+    return branch
+
+
 async def ensure_repo(gh_token: str, owner: str) -> str:
     """Create the user's ``ontorag-data`` repo if it doesn't exist.
 
     Returns the full repo name (``owner/ontorag-data``).
     """
     full = f"{owner}/{REPO_NAME}"
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(f"{_API}/repos/{full}", headers=_headers(gh_token))
-        if resp.status_code == 200:
-            _log.debug("Repo %s already exists", full)
-            return full
-
-        _log.info("Creating repo %s", full)
-        resp = await client.post(
-            f"{_API}/user/repos",
-            headers=_headers(gh_token),
-            json={
-                "name": REPO_NAME,
-                "description": REPO_DESCRIPTION,
-                "private": True,
-                "auto_init": True,
-            },
-        )
-        resp.raise_for_status()
+    resp = await _client.get(f"{_API}/repos/{full}", headers=_headers(gh_token))
+    if resp.status_code == 200:
+        _log.debug("Repo %s already exists", full)
+        _remember_branch(full, resp.json().get("default_branch"))
+        return full
+
+    _log.info("Creating repo %s", full)
+    resp = await _client.post(
+        f"{_API}/user/repos",
+        headers=_headers(gh_token),
+        json={
+            "name": REPO_NAME,
+            "description": REPO_DESCRIPTION,
+            "private": True,
+            "auto_init": True,
+        },
+    )
+    resp.raise_for_status()
+    _remember_branch(full, resp.json().get("default_branch"))
     return full
 
 
@@ -70,64 +112,116 @@ async def ensure_repo(gh_token: str, owner: str) -> str:
 
 async def file_exists(gh_token: str, repo: str, path: str) -> bool:
     """Check whether a file exists in the repo (HEAD request)."""
-    async with httpx.AsyncClient() as client:
-        resp = await client.head(
-            f"{_API}/repos/{repo}/contents/{path}",
-            headers=_headers(gh_token),
-        )
+    resp = await _client.head(
+        f"{_API}/repos/{repo}/contents/{path}",
+        headers=_headers(gh_token),
+    )
     return resp.status_code == 200
 
 
-async def read_file(gh_token: str, repo: str, path: str) -> Optional[str]:
-    """Read a UTF-8 file from the repo.  Returns None if not found."""
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(
-            f"{_API}/repos/{repo}/contents/{path}",
-            headers=_headers(gh_token),
-        )
+async def read_file(gh_token: str, repo: str, path: str) -> Optional[bytes]:
+    """Read a file from the repo.  Returns None if not found.
+
+    Requests the raw media type, so GitHub sends the file body directly
+    instead of a JSON envelope with base64 content — no decode pass and
+    no size-of-file intermediate allocations.
+    """
+    headers = _headers(gh_token)
+    headers["Accept"] = "application/vnd.github.raw+json"
+    resp = await _client.get(
+        f"{_API}/repos/{repo}/contents/{path}",
+        headers=headers,
+    )
     if resp.status_code == 404:
         return None
     resp.raise_for_status()
+    return resp.content
+
+
+# Blob SHAs observed on previous writes, keyed by (repo, path): update
+# PUTs can reuse them instead of a GET round-trip.  Stale entries are
+# healed by the 409/422 retry below.
+_sha_cache: dict[tuple[str, str], str] = {}
+_SHA_CACHE_MAX = 4096
+
+
+async def _put_contents(
+    gh_token: str,
+    repo: str,
+    path: str,
+    encoded: str,
+    message: str,
+) -> str:
+    """PUT a base64 payload, fetching the SHA only when required.
+
+    New files — the common case right after the dedup check — land in a
+    single round-trip.  If GitHub rejects the PUT because the file
+    already exists (or a cached SHA went stale), the current SHA is
+    fetched and the PUT retried once as an update.
+    """
+    headers = _headers(gh_token)
+    url = f"{_API}/repos/{repo}/contents/{path}"
+    body: dict = {"message": message, "content": encoded}
+
+    sha = _sha_cache.get((repo, path))
+    if sha:
+        body["sha"] = sha
+
+    resp = await _client.put(url, headers=headers, json=body)
+    if resp.status_code in (409, 422):
+        head = await _client.get(url, headers=headers)
+        if head.status_code == 200:
+            body["sha"] = head.json().get("sha")
+            resp = await _client.put(url, headers=headers, json=body)
+    resp.raise_for_status()
+
     data = resp.json()
-    content_b64 = data.get("content", "")
-    return base64.b64decode(content_b64).decode("utf-8")
+    new_sha = (data.get("content") or {}).get("sha")
+    if new_sha:
+        if len(_sha_cache) >= _SHA_CACHE_MAX:
+            _sha_cache.clear()
+        _sha_cache[(repo, path)] = new_sha
+    return data.get("commit", {}).get("sha", "")
+
+
+async def list_dir(gh_token: str, repo: str, path: str) -> list[str]:
+    """List blob names under a repo directory.
+
+    Uses the Git Trees API (``HEAD:<path>``): one request returning a
+    few fields per entry, versus the Contents listing's full metadata
+    object per file.  Returns [] when the directory doesn't exist.
+    """
+    resp = await _client.get(
+        f"{_API}/repos/{repo}/git/trees/HEAD:{path}",
+        headers=_headers(gh_token),
+    )
+    if resp.status_code == 404:
+        return []
+    resp.raise_for_status()
+    return [
+        entry["path"]
+        for entry in resp.json().get("tree", [])
+        if entry.get("type") == "blob"
+    ]
 
 
 async def write_file(
     gh_token: str,
     repo: str,
     path: str,
-    content: str,
+    content: str | bytes,
     message: str = "ontorag-hub: update artifact",
 ) -> str:
-    """Create or update a file in the repo.  Returns the commit SHA."""
-    encoded = base64.b64encode(content.encode("utf-8")).decode("ascii")
-
-    # Get the current SHA if the file exists (required for updates)
-    sha: Optional[str] = None
-    async with httpx.AsyncClient() as client:
-        head = await client.get(
-            f"{_API}/repos/{repo}/contents/{path}",
-            headers=_headers(gh_token),
-        )
-        if head.status_code == 200:
-            sha = head.json().get("sha")
+    """Create or update a file in the repo.  Returns the commit SHA.
 
-        body: dict = {
-            "message": message,
-            "content": encoded,
-        }
-        if sha:
-            body["sha"] = sha
-
-        resp = await client.put(
-            f"{_API}/repos/{repo}/contents/{path}",
-            headers=_headers(gh_token),
-            json=body,
-        )
-        resp.raise_for_status()
-        commit_sha = resp.json().get("commit", {}).get("sha", "")
+    Accepts bytes directly so callers serializing with orjson don't pay
+    for a decode/re-encode round-trip.
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    encoded = base64.b64encode(content).decode("ascii")
 
+    commit_sha = await _put_contents(gh_token, repo, path, encoded, message)
     _log.debug("Wrote %s/%s (commit=%s)", repo, path, commit_sha[:8])
     return commit_sha
 
@@ -142,26 +236,87 @@ async def write_file_bytes(
     """Create or update a binary file in the repo.  Returns the commit SHA."""
     encoded = base64.b64encode(data).decode("ascii")
 
-    sha: Optional[str] = None
-    async with httpx.AsyncClient() as client:
-        head = await client.get(
-            f"{_API}/repos/{repo}/contents/{path}",
-            headers=_headers(gh_token),
-        )
-        if head.status_code == 200:
-            sha = head.json().get("sha")
+    commit_sha = await _put_contents(gh_token, repo, path, encoded, message)
+    _log.debug("Wrote bytes %s/%s (commit=%s)", repo, path, commit_sha[:8])
+    return commit_sha
 
-        body: dict = {"message": message, "content": encoded}
-        if sha:
-            body["sha"] = sha
 
-        resp = await client.put(
-            f"{_API}/repos/{repo}/contents/{path}",
-            headers=_headers(gh_token),
-            json=body,
+async def write_files_batch(
+    gh_token: str,
+    repo: str,
+    files: list[tuple[str, str | bytes]],
+    message: str = "ontorag-hub: update artifacts",
+    branch: Optional[str] = None,
+) -> str:
+    """Write several files in one commit via the Git Data API.
+
+    The Contents API costs a GET-for-SHA plus a PUT per file; here the
+    blobs are uploaded concurrently, then one tree + one commit + one
+    ref update land everything atomically.  Writes to the repo's
+    default branch unless *branch* is given.  Returns the commit SHA.
+    """
+    headers = _headers(gh_token)
+    if branch is None:
+        branch = await _default_branch(gh_token, repo)
+
+    async def _blob(content: str | bytes) -> str:
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        resp = await _client.post(
+            f"{_API}/repos/{repo}/git/blobs",
+            headers=headers,
+            json={
+                "content": base64.b64encode(content).decode("ascii"),
+                "encoding": "base64",
+            },
         )
         resp.raise_for_status()
-        commit_sha = resp.json().get("commit", {}).get("sha", "")
-
-    _log.debug("Wrote bytes %s/%s (commit=%s)", repo, path, commit_sha[:8])
+        return resp.json()["sha"]
+
+    blob_shas = await asyncio.gather(*(_blob(content) for _, content in files))
+
+    ref = await _client.get(
+        f"{_API}/repos/{repo}/git/ref/heads/{branch}", headers=headers
+    )
+    ref.raise_for_status()
+    base_commit = ref.json()["object"]["sha"]
+
+    base = await _client.get(
+        f"{_API}/repos/{repo}/git/commits/{base_commit}", headers=headers
+    )
+    base.raise_for_status()
+
+    tree = await _client.post(
+        f"{_API}/repos/{repo}/git/trees",
+        headers=headers,
+        json={
+            "base_tree": base.json()["tree"]["sha"],
+            "tree": [
+                {"path": path, "mode": "100644", "type": "blob", "sha": sha}
+                for (path, _), sha in zip(files, blob_shas)
+            ],
+        },
+    )
+    tree.raise_for_status()
+
+    commit = await _client.post(
+        f"{_API}/repos/{repo}/git/commits",
+        headers=headers,
+        json={
+            "message": message,
+            "tree": tree.json()["sha"],
+            "parents": [base_commit],
+        },
+    )
+    commit.raise_for_status()
+    commit_sha = commit.json()["sha"]
+
+    patch = await _client.patch(
+        f"{_API}/repos/{repo}/git/refs/heads/{branch}",
+        headers=headers,
+        json={"sha": commit_sha},
+    )
+    patch.raise_for_status()
+
+    _log.debug("Wrote %d files to %s (commit=%s)", len(files), repo, commit_sha[:8])
     return commit_sha
@@ -70,6 +70,19 @@ class ExtractInstancesResult(BaseModel):
     triples: int = 0
 
 
+# ── Combined extraction ─────────────────────────────────────────────
+
+class ExtractAllRequest(BaseModel):
+    document_id: str
+    schema_card_slug: str
+
+
+class ExtractAllResult(BaseModel):
+    document_id: str
+    schema_result: ExtractSchemaResult
+    instances_result: ExtractInstancesResult
+
+
 # ── Ontology registry ───────────────────────────────────────────────
 
 class OntologySummary(BaseModel):
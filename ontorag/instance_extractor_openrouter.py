@@ -1,59 +1,23 @@
 from __future__ import annotations
-import json
-import os
-import time
 import hashlib
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
-import requests
+import orjson
 
+from ontorag import openrouter
+from ontorag.openrouter import OPENROUTER_MODEL
 from ontorag.verbosity import get_logger
 
 _log = get_logger("ontorag.instance_extractor")
 
-OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
-OPENROUTER_MODEL = os.getenv("OPENROUTER_MODEL", "openai/gpt-4o-mini")
-OPENROUTER_BASE_URL = os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1")
-APP_NAME = os.getenv("OPENROUTER_APP_NAME", "OntoRAG")
-SITE_URL = os.getenv("OPENROUTER_SITE_URL", "https://ontorag.github.io")
-
-def _strip_fences(s: str) -> str:
-    s = s.strip()
-    if s.startswith("```"):
-        s = s.split("```", 2)[1].strip()
-        if s.startswith("json"):
-            s = s[4:].strip()
-    return s
-
-def _chat_json(system: str, user: str) -> Dict[str, Any]:
-    if not OPENROUTER_API_KEY:
-        raise RuntimeError("OPENROUTER_API_KEY is not set")
-
-    url = f"{OPENROUTER_BASE_URL}/chat/completions"
-    headers = {
-        "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-        "Content-Type": "application/json",
-        "HTTP-Referer": SITE_URL,
-        "X-Title": APP_NAME,
-    }
-    payload = {
-        "model": OPENROUTER_MODEL,
-        "messages": [
-            {"role": "system", "content": system},
-            {"role": "user", "content": user},
-        ],
-        "temperature": 0.2,
-    }
+_SYSTEM = "You extract structured instances grounded in a provided ontology. Output JSON only."
 
-    _log.debug("API request: model=%s prompt_len=%d", OPENROUTER_MODEL, len(user))
-    r = requests.post(url, headers=headers, json=payload, timeout=120)
-    r.raise_for_status()
-    content = r.json()["choices"][0]["message"]["content"]
-    _log.debug("API response: %d chars", len(content))
-    content = _strip_fences(content)
-    return json.loads(content)
+def _build_system(schema_card: Dict[str, Any]) -> str:
+    """Static prompt prefix: schema card + output contract.
 
-def build_instance_prompt(chunk_dto: Dict[str, Any], schema_card: Dict[str, Any]) -> str:
+    Serialized once per run and byte-identical across the batch so
+    providers with prefix caching can reuse the prefill.
+    """
     schema_slim = {
         "namespace": schema_card.get("namespace"),
         "classes": schema_card.get("classes", []),
@@ -66,23 +30,20 @@ def build_instance_prompt(chunk_dto: Dict[str, Any], schema_card: Dict[str, Any]
 You are an information extraction engine grounded in a known ontology.
 
 You receive:
-- A CHUNK DTO (text + provenance)
 - A SCHEMA CARD (classes + properties + relations)
+- A CHUNK DTO (text + provenance)
 
 Task:
 Extract instance candidates mentioned in the chunk and express them as STRICT JSON.
 Use ONLY class/property/relation names that exist in the schema card.
 If the chunk mentions a concept not representable with the current schema, add it to "warnings" (do not invent schema).
 
-CHUNK DTO (JSON):
-{json.dumps(chunk_dto, ensure_ascii=False)}
-
 SCHEMA CARD (JSON):
-{json.dumps(schema_slim, ensure_ascii=False)}
+{orjson.dumps(schema_slim).decode()}
 
 OUTPUT (STRICT JSON):
 {{
-  "chunk_id": "{chunk_dto.get("chunk_id","")}",
+  "chunk_id": "<copy the chunk_id from the CHUNK DTO>",
   "instances": [
     {{
       "class": "ClassName",
@@ -120,39 +81,85 @@ Rules:
 - Output JSON only (no markdown, no commentary).
 """.strip()
 
+
+def _build_user(chunk_dto: Dict[str, Any]) -> str:
+    """Dynamic per-chunk suffix."""
+    return f"CHUNK DTO (JSON):\n{orjson.dumps(chunk_dto).decode()}"
+
+def _prepare_jobs(
+    chunks: List[Dict[str, Any]],
+    schema_card: Dict[str, Any],
+) -> tuple[List[tuple[str, str]], List[int]]:
+    """Build one job per distinct chunk text; duplicates share a dispatch."""
+    system = f"{_SYSTEM}\n\n{_build_system(schema_card)}"
+    jobs: List[tuple[str, str]] = []
+    job_of: List[int] = []
+    first_by_fp: Dict[str, int] = {}
+    for ch in chunks:
+        fp = ch.get("text_hash") or hashlib.blake2b(
+            (ch.get("text") or "").encode(), digest_size=16
+        ).hexdigest()
+        j = first_by_fp.get(fp)
+        if j is None:
+            j = first_by_fp[fp] = len(jobs)
+            jobs.append((system, _build_user(ch)))
+        job_of.append(j)
+    if len(jobs) < len(chunks):
+        _log.info("Prompt dedup: %d chunks -> %d unique dispatches", len(chunks), len(jobs))
+    return jobs, job_of
+
+
+def _fan_out(
+    chunks: List[Dict[str, Any]],
+    job_of: List[int],
+    results: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    out: List[Dict[str, Any]] = []
+    for i, ch in enumerate(chunks):
+        data = results[job_of[i]]
+        chunk_id = ch.get("chunk_id", f"#{i}")
+        if data.get("chunk_id") != chunk_id:
+            data = {**data, "chunk_id": chunk_id}
+        out.append(data)
+    return out
+
+
 def extract_instance_chunk_proposals(
     chunks: List[Dict[str, Any]],
     schema_card: Dict[str, Any],
     max_retries: int = 3
 ) -> List[Dict[str, Any]]:
-    system = "You extract structured instances grounded in a provided ontology. Output JSON only."
-    out: List[Dict[str, Any]] = []
+    """Extract instance proposals for every chunk, one LLM call per chunk.
+
+    Calls fan out concurrently via :mod:`ontorag.openrouter`; results
+    keep chunk order.
+    """
     total = len(chunks)
+    _log.info("Instance extraction: %d chunks, model=%s", total, OPENROUTER_MODEL)
+
+    jobs, job_of = _prepare_jobs(chunks, schema_card)
+    results = openrouter.gather_chat_json_sync(jobs, max_retries=max_retries, timeout=120.0)
+    out = _fan_out(chunks, job_of, results)
+
+    _log.info("Instance extraction complete: %d proposals from %d chunks", len(out), total)
+    return out
 
+
+async def extract_instance_chunk_proposals_async(
+    chunks: List[Dict[str, Any]],
+    schema_card: Dict[str, Any],
+    max_retries: int = 3,
+    concurrency: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Async variant of :func:`extract_instance_chunk_proposals`."""
+    total = len(chunks)
     _log.info("Instance extraction: %d chunks, model=%s", total, OPENROUTER_MODEL)
 
-    for i, ch in enumerate(chunks):
-        chunk_id = ch.get("chunk_id", f"#{i}")
-        _log.info("  [%d/%d] Processing chunk %s", i + 1, total, chunk_id)
-        user = build_instance_prompt(ch, schema_card)
-
-        for attempt in range(max_retries):
-            try:
-                data = _chat_json(system, user)
-                n_inst = len(data.get("instances", []))
-                _log.debug("  -> extracted %d instances", n_inst)
-                out.append(data)
-                break
-            except Exception as e:
-                _log.info("  Retry %d/%d for chunk %s: %s", attempt + 1, max_retries, chunk_id, e)
-                if attempt == max_retries - 1:
-                    raise
-                time.sleep(1.5 * (attempt + 1))
-
-        # Rate-limit between chunks to avoid hitting API limits
-        if i < total - 1:
-            _log.debug("  Rate-limit pause (10s)")
-            time.sleep(10)
+    jobs, job_of = _prepare_jobs(chunks, schema_card)
+    results = await openrouter.gather_chat_json(
+        jobs, concurrency=concurrency, max_retries=max_retries, timeout=120.0,
+    )
+    out = _fan_out(chunks, job_of, results)
 
     _log.info("Instance extraction complete: %d proposals from %d chunks", len(out), total)
     return out
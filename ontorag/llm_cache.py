@@ -0,0 +1,91 @@
+# ontorag/llm_cache.py
+"""
+Content-addressed disk cache for LLM responses.
+
+Re-running the pipeline on the same chunks repays the full API bill and
+latency every time.  With ``ONTORAG_LLM_CACHE=1`` each parsed chat
+response is stored under ``sha256(model\\0system\\0user)``, so identical
+requests short-circuit the HTTP call entirely — free re-runs during
+development and safe checkpoint/resume for long extractions.
+
+Entries live at ``<cache_dir>/<key[:2]>/<key>.json`` (fan-out keeps
+directories small) and are written atomically via ``os.replace``.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import orjson
+
+from ontorag.verbosity import get_logger
+
+_log = get_logger("ontorag.llm_cache")
+
+_DEFAULT_DIR = Path.home() / ".cache" / "ontorag" / "llm"
+
+
+def enabled() -> bool:
+    return os.getenv("ONTORAG_LLM_CACHE") == "1"
+
+
+def cache_dir() -> Path:
+    return Path(os.getenv("ONTORAG_LLM_CACHE_DIR", str(_DEFAULT_DIR)))
+
+
+def cache_key(model: str, system: str, user: str) -> str:
+    return hashlib.sha256(f"{model}\0{system}\0{user}".encode()).hexdigest()
+
+
+def _entry_path(key: str) -> Path:
+    return cache_dir() / key[:2] / f"{key}.json"
+
+
+def get(key: str) -> Optional[Dict[str, Any]]:
+    """Return the cached response for ``key``, or None on miss."""
+    path = _entry_path(key)
+    try:
+        data = orjson.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    _log.debug("LLM cache hit: %s", key[:12])
+    return data
+
+
+def put(key: str, value: Dict[str, Any]) -> None:
+    """Store ``value`` under ``key`` atomically (best effort)."""
+    path = _entry_path(key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=path.parent, suffix=".tmp", delete=False
+        ) as tmp:
+            tmp.write(orjson.dumps(value))
+        os.replace(tmp.name, path)
+    except OSError as e:
+        # A broken cache write must never fail the extraction itself.
+        _log.info("LLM cache write failed for %s: %s", key[:12], e)
+
+
+def cached_chat_json(
+    model: str,
+    system: str,
+    user: str,
+    fn: Callable[[], Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Sync helper: look up ``(model, system, user)``, calling ``fn`` on miss.
+
+    No-op passthrough when the cache is disabled.
+    """
+    if not enabled():
+        return fn()
+    key = cache_key(model, system, user)
+    hit = get(key)
+    if hit is not None:
+        return hit
+    value = fn()
+    put(key, value)
+    return value
@@ -1,11 +1,11 @@
 # ontorag/mcp_backend.py
 from __future__ import annotations
 
-import json
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Dict
 
+import orjson
 import requests
 from rdflib import Graph
 from rdflib.plugins.sparql.processor import SPARQLResult
@@ -39,10 +39,9 @@ class LocalRdfBackend(SparqlBackend):
 
     def select(self, query: str) -> Dict[str, Any]:
         result: SPARQLResult = self._graph.query(query)
-        raw = result.serialize(format="json")
-        if isinstance(raw, bytes):
-            raw = raw.decode("utf-8")
-        return json.loads(raw)
+        # orjson parses the serialized result bytes directly — no utf-8
+        # decode pass and a much faster parse on large result sets.
+        return orjson.loads(result.serialize(format="json"))
 
     def construct(self, query: str, accept: str = "text/turtle") -> str:
         result = self._graph.query(query)
@@ -81,7 +80,7 @@ class RemoteSparqlBackend(SparqlBackend):
             timeout=60,
         )
         r.raise_for_status()
-        return r.json()
+        return orjson.loads(r.content)
 
     def construct(self, query: str, accept: str = "text/turtle") -> str:
         r = requests.post(
@@ -7,9 +7,10 @@ catalog tools as plain async methods that return dicts.
 """
 from __future__ import annotations
 
-import json
+import asyncio
 from typing import Any, Dict, List, Optional
 
+import orjson
 from mcp.client.sse import sse_client
 from mcp.client.session import ClientSession
 
@@ -19,39 +20,116 @@ _log = get_logger("ontorag.mcp_client")
 
 
 class OntologyCatalogMCPClient:
-    """Thin async wrapper around the ontology-catalog MCP server."""
+    """Thin async wrapper around the ontology-catalog MCP server.
+
+    Holds one long-lived SSE session: the TCP connect + MCP handshake
+    happen on the first call (or on ``__aenter__``) and are reused by
+    every tool call afterwards.  Usable as an async context manager;
+    call :meth:`aclose` on shutdown otherwise.
+    """
 
     def __init__(self, mcp_url: str) -> None:
         self.mcp_url = mcp_url
+        self._session: Optional[ClientSession] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._close: Optional[asyncio.Event] = None
+        self._connect_lock = asyncio.Lock()
         _log.info("MCP client target: %s", mcp_url)
 
+    async def _run_session(
+        self,
+        ready: "asyncio.Future[ClientSession]",
+        close: asyncio.Event,
+    ) -> None:
+        """Own the transport + session contexts for their whole life.
+
+        ``sse_client`` and ``ClientSession`` are anyio task-group based:
+        their cancel scopes must be exited from the task that entered
+        them.  Running both inside this dedicated task keeps request
+        tasks and the lifespan shutdown out of those scopes — they only
+        ever signal ``close`` and await this task.
+        """
+        try:
+            async with sse_client(self.mcp_url) as streams:
+                async with ClientSession(*streams) as session:
+                    await session.initialize()
+                    ready.set_result(session)
+                    await close.wait()
+        except BaseException as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                _log.debug("MCP session worker ended: %r", e)
+
+    async def _ensure_session(self) -> ClientSession:
+        async with self._connect_lock:
+            if self._session is not None and self._worker is not None and not self._worker.done():
+                return self._session
+            self._session = None
+            _log.debug("Opening MCP session to %s", self.mcp_url)
+            ready: "asyncio.Future[ClientSession]" = asyncio.get_running_loop().create_future()
+            self._close = asyncio.Event()
+            self._worker = asyncio.create_task(self._run_session(ready, self._close))
+            try:
+                self._session = await ready
+            except BaseException:
+                self._worker = None
+                raise
+            return self._session
+
+    async def aclose(self) -> None:
+        """Tear down the SSE session (no-op if never connected)."""
+        async with self._connect_lock:
+            worker, self._worker, self._session = self._worker, None, None
+            close, self._close = self._close, None
+            if worker is None:
+                return
+            if close is not None:
+                close.set()
+            try:
+                await worker
+            except BaseException:
+                _log.debug("MCP session closed with error", exc_info=True)
+
+    async def __aenter__(self) -> "OntologyCatalogMCPClient":
+        await self._ensure_session()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
     async def _call_tool(self, name: str, arguments: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Open an SSE session, call one tool, return the parsed JSON result."""
+        """Call one tool on the shared session, return the parsed JSON result."""
         _log.debug("MCP call_tool: %s(%s)", name, arguments or {})
-        async with sse_client(self.mcp_url) as streams:
-            async with ClientSession(*streams) as session:
-                await session.initialize()
-                result = await session.call_tool(name, arguments or {})
+        session = await self._ensure_session()
+        try:
+            result = await session.call_tool(name, arguments or {})
+        except Exception:
+            # Stale stream (server restart, idle timeout) — reconnect once.
+            _log.debug("MCP session failed for %s; reconnecting", name, exc_info=True)
+            await self.aclose()
+            session = await self._ensure_session()
+            result = await session.call_tool(name, arguments or {})
+
+        # One pass over the content blocks; the hasattr probe runs once
+        # per block instead of once per branch.
+        texts = [block.text for block in result.content if hasattr(block, "text")]
 
         if result.isError:
-            text = ""
-            for block in result.content:
-                if hasattr(block, "text"):
-                    text += block.text
+            text = "".join(texts)
             _log.debug("MCP tool error: %s", text)
             return {"error": text}
 
+        if not texts:
+            return {}
+
         # Parse the first text content block as JSON; fall back to raw text
-        for block in result.content:
-            if hasattr(block, "text"):
-                try:
-                    parsed = json.loads(block.text)
-                    _log.debug("MCP result: %s keys", list(parsed.keys()) if isinstance(parsed, dict) else type(parsed).__name__)
-                    return parsed
-                except (json.JSONDecodeError, TypeError):
-                    return {"raw": block.text}
-
-        return {}
+        try:
+            parsed = orjson.loads(texts[0])
+        except orjson.JSONDecodeError:
+            return {"raw": texts[0]}
+        _log.debug("MCP result: %s keys", list(parsed.keys()) if isinstance(parsed, dict) else type(parsed).__name__)
+        return parsed
 
     # ── Tool wrappers ────────────────────────────────────────────────
 
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import functools
 import re
 from typing import Optional, Dict, Any
 
@@ -20,6 +21,28 @@ def _sanitize_iri(iri: str) -> str:
     return iri
 
 
+# Query templates interpolated per call instead of rebuilding the
+# literal text in each tool body.
+_DESCRIBE_TMPL = "DESCRIBE <{iri}>"
+_LIST_BY_CLASS_TMPL = (
+    "SELECT ?s ?label WHERE {{ ?s a <{iri}> . "
+    "OPTIONAL {{ ?s <http://www.w3.org/2000/01/rdf-schema#label> ?label }} "
+    "}} LIMIT {lim}"
+)
+_OUTGOING_TMPL = "SELECT ?p ?o WHERE {{ <{iri}> ?p ?o }} LIMIT {lim}"
+_INCOMING_TMPL = "SELECT ?s ?p WHERE {{ ?s ?p <{iri}> }} LIMIT {lim}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_query(tmpl: str, iri: str, limit: int) -> str:
+    """Format (and memoize) a single-IRI query.
+
+    DESCRIBE-expansion workflows hit the same (iri, limit) pairs over
+    and over; caching skips sanitization and interpolation on repeats.
+    """
+    return tmpl.format(iri=_sanitize_iri(iri), lim=int(limit))
+
+
 def create_mcp_app(backend: SparqlBackend) -> FastMCP:
     _log.info("Creating MCP app with backend %s", type(backend).__name__)
     app = FastMCP("ontorag-mcp")
@@ -41,35 +64,23 @@ def create_mcp_app(backend: SparqlBackend) -> FastMCP:
     def describe(iri: str, accept: str = "text/turtle") -> Dict[str, Any]:
         """DESCRIBE a resource by IRI."""
         _log.debug("tool:describe iri=%s", iri)
-        iri = _sanitize_iri(iri)
-        q = f"DESCRIBE <{iri}>"
+        q = _build_query(_DESCRIBE_TMPL, iri, 0)
         data = backend.construct(q, accept=accept)
         return {"content_type": accept, "data": data}
 
     @app.tool()
     def list_by_class(class_iri: str, limit: int = 50) -> Dict[str, Any]:
         """List instances of a class."""
-        class_iri = _sanitize_iri(class_iri)
-        q = f"""
-        SELECT ?s ?label WHERE {{
-          ?s a <{class_iri}> .
-          OPTIONAL {{ ?s <http://www.w3.org/2000/01/rdf-schema#label> ?label }}
-        }} LIMIT {int(limit)}
-        """
-        return backend.select(q)
+        return backend.select(_build_query(_LIST_BY_CLASS_TMPL, class_iri, limit))
 
     @app.tool()
     def outgoing(iri: str, limit: int = 100) -> Dict[str, Any]:
         """Outgoing edges from a resource."""
-        iri = _sanitize_iri(iri)
-        q = f"SELECT ?p ?o WHERE {{ <{iri}> ?p ?o }} LIMIT {int(limit)}"
-        return backend.select(q)
+        return backend.select(_build_query(_OUTGOING_TMPL, iri, limit))
 
     @app.tool()
     def incoming(iri: str, limit: int = 100) -> Dict[str, Any]:
         """Incoming edges to a resource."""
-        iri = _sanitize_iri(iri)
-        q = f"SELECT ?s ?p WHERE {{ ?s ?p <{iri}> }} LIMIT {int(limit)}"
-        return backend.select(q)
+        return backend.select(_build_query(_INCOMING_TMPL, iri, limit))
 
     return app
@@ -1,39 +1,38 @@
 # ontorag/ontology_extractor_openrouter.py
 from __future__ import annotations
-import json
-import os
-import time
+import hashlib
+from collections import defaultdict
 from typing import Callable, List, Dict, Any, Optional
 
+import orjson
+
 ChunkProgressCallback = Callable[[int, int, str, Dict[str, Any]], None]
 """(chunk_index, total_chunks, chunk_id, proposal_or_error) → None"""
 
-import requests
-
+from ontorag import openrouter
+from ontorag.openrouter import OPENROUTER_MODEL
 from ontorag.verbosity import get_logger
 
 _log = get_logger("ontorag.ontology_extractor")
 
-OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
-OPENROUTER_MODEL = os.getenv("OPENROUTER_MODEL", "openai/gpt-4o-mini")
-OPENROUTER_BASE_URL = os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1")
+_SYSTEM = "You are a careful ontology induction engine. Output JSON only."
 
-APP_NAME = os.getenv("OPENROUTER_APP_NAME", "OntoRAG")
-SITE_URL = os.getenv("OPENROUTER_SITE_URL", "https://ontorag.github.io")
 
-def _build_prompt(chunk: Dict[str, Any], schema_card: Dict[str, Any]) -> str:
-    return f"""
-You are an ontology induction engine.
+def _build_system(schema_card: Dict[str, Any]) -> str:
+    """Static prompt prefix: schema card + output contract.
 
-CHUNK DTO (JSON):
-{json.dumps(chunk, ensure_ascii=False)}
+    Serialized once per run (not once per chunk), and byte-identical
+    across the whole batch so providers with prefix caching can reuse
+    the prefill for every request.
+    """
+    return f"""{_SYSTEM}
 
 CURRENT SCHEMA CARD (JSON):
-{json.dumps(schema_card, ensure_ascii=False)}
+{orjson.dumps(schema_card).decode()}
 
 Return STRICT JSON with this structure:
 {{
-  "chunk_id": "{chunk.get("chunk_id","")}",
+  "chunk_id": "<copy the chunk_id from the CHUNK DTO>",
   "proposed_additions": {{
     "classes": [],
     "datatype_properties": [],
@@ -50,80 +49,167 @@ Rules:
 - Prefer generic names over examples.
 - Reuse existing schema items when possible.
 - Evidence quotes must be short (<= 25 words) and copied from the chunk.
-- Output JSON only. No extra text.
-""".strip()
-
-def _chat_json(system: str, user: str) -> Dict[str, Any]:
-    if not OPENROUTER_API_KEY:
-        raise RuntimeError("OPENROUTER_API_KEY is not set")
-
-    url = f"{OPENROUTER_BASE_URL}/chat/completions"
-    headers = {
-        "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-        "Content-Type": "application/json",
-        "HTTP-Referer": SITE_URL,
-        "X-Title": APP_NAME,
-    }
-    payload = {
-        "model": OPENROUTER_MODEL,
-        "messages": [
-            {"role": "system", "content": system},
-            {"role": "user", "content": user},
-        ],
-        "temperature": 0.2,
-    }
-
-    _log.debug("API request: model=%s prompt_len=%d", OPENROUTER_MODEL, len(user))
-    r = requests.post(url, headers=headers, json=payload, timeout=90)
-    r.raise_for_status()
-    content = r.json()["choices"][0]["message"]["content"]
-    _log.debug("API response: %d chars", len(content))
-
-    # robust JSON parse (strip fences if present)
-    content = content.strip()
-    if content.startswith("```"):
-        content = content.split("```", 2)[1].strip()
-        if content.startswith("json"):
-            content = content[4:].strip()
-
-    return json.loads(content)
+- Output JSON only. No extra text."""
+
+
+def _build_user(chunk: Dict[str, Any]) -> str:
+    """Dynamic per-chunk suffix."""
+    return f"CHUNK DTO (JSON):\n{orjson.dumps(chunk).decode()}"
+
+
+def _prepare_jobs(
+    chunks: List[Dict[str, Any]],
+    schema_card: Dict[str, Any],
+) -> tuple[List[tuple[str, str]], List[int]]:
+    """Build one job per distinct chunk text.
+
+    Boilerplate (headers, TOCs, repeated clauses) produces chunks whose
+    text — and therefore whose proposals — are identical, so duplicates
+    dispatch once and share the response.  Returns the unique job list
+    and, per chunk, the index of the job that serves it.
+    """
+    system = _build_system(schema_card)
+    jobs: List[tuple[str, str]] = []
+    job_of: List[int] = []
+    first_by_fp: Dict[str, int] = {}
+    for ch in chunks:
+        fp = ch.get("text_hash") or hashlib.blake2b(
+            (ch.get("text") or "").encode(), digest_size=16
+        ).hexdigest()
+        j = first_by_fp.get(fp)
+        if j is None:
+            j = first_by_fp[fp] = len(jobs)
+            jobs.append((system, _build_user(ch)))
+        job_of.append(j)
+    if len(jobs) < len(chunks):
+        _log.info("Prompt dedup: %d chunks -> %d unique dispatches", len(chunks), len(jobs))
+    return jobs, job_of
+
+
+def _patched(data: Dict[str, Any], chunk_id: str) -> Dict[str, Any]:
+    """Shallow copy with the chunk's own id (no-op when it already matches)."""
+    if data.get("chunk_id") == chunk_id:
+        return data
+    return {**data, "chunk_id": chunk_id}
+
+
+def _fan_out(
+    chunks: List[Dict[str, Any]],
+    job_of: List[int],
+    results: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    return [
+        _patched(results[job_of[i]], ch.get("chunk_id", f"#{i}"))
+        for i, ch in enumerate(chunks)
+    ]
+
+
+def _wrap_progress(
+    chunks: List[Dict[str, Any]],
+    job_of: List[int],
+    on_chunk_done: Optional[ChunkProgressCallback],
+) -> Optional[openrouter.JobDoneCallback]:
+    if on_chunk_done is None:
+        return None
+
+    chunks_of: Dict[int, List[int]] = defaultdict(list)
+    for i, j in enumerate(job_of):
+        chunks_of[j].append(i)
+    total = len(chunks)
+
+    def _done(j: int, _total_jobs: int, data: Dict[str, Any]) -> None:
+        for i in chunks_of[j]:
+            chunk_id = chunks[i].get("chunk_id", f"#{i}")
+            on_chunk_done(i, total, chunk_id, _patched(data, chunk_id))
+
+    return _done
+
 
 def extract_schema_chunk_proposals(
     chunks: List[Dict[str, Any]],
     schema_card: Dict[str, Any],
     on_chunk_done: Optional[ChunkProgressCallback] = None,
 ) -> List[Dict[str, Any]]:
-    system = "You are a careful ontology induction engine. Output JSON only."
-    out: List[Dict[str, Any]] = []
-    total = len(chunks)
+    """Extract schema proposals for every chunk, one LLM call per chunk.
 
+    Calls fan out concurrently via :mod:`ontorag.openrouter`; results
+    keep chunk order.
+    """
+    total = len(chunks)
     _log.info("Schema extraction: %d chunks, model=%s", total, OPENROUTER_MODEL)
 
+    jobs, job_of = _prepare_jobs(chunks, schema_card)
+    results = openrouter.gather_chat_json_sync(
+        jobs, on_done=_wrap_progress(chunks, job_of, on_chunk_done),
+    )
+    out = _fan_out(chunks, job_of, results)
+
+    _log.info("Schema extraction complete: %d proposals from %d chunks", len(out), total)
+    return out
+
+
+def extract_schema_chunk_proposals_batch(
+    chunks: List[Dict[str, Any]],
+    schema_card: Dict[str, Any],
+    poll_interval: float = 30.0,
+) -> List[Dict[str, Any]]:
+    """Batch-API variant of :func:`extract_schema_chunk_proposals`.
+
+    Ontology induction over a large corpus is offline and
+    non-interactive, so all chunk prompts go up as one Batch API job
+    (cheaper per token, no rate-limit pacing) and this call blocks —
+    possibly for hours — until the provider finishes.  Results keep
+    chunk order; chunks the batch returned nothing usable for get an
+    empty proposal with a warning so downstream aggregation is
+    unchanged.
+    """
+    total = len(chunks)
+    _log.info("Schema extraction (batch): %d chunks, model=%s", total, OPENROUTER_MODEL)
+
+    system = _build_system(schema_card)
+    jobs = [
+        (ch.get("chunk_id", f"#{i}"), system, _build_user(ch))
+        for i, ch in enumerate(chunks)
+    ]
+    by_id = openrouter.batch_chat_json(jobs, poll_interval=poll_interval)
+
+    out: List[Dict[str, Any]] = []
     for i, ch in enumerate(chunks):
         chunk_id = ch.get("chunk_id", f"#{i}")
-        _log.info("  [%d/%d] Processing chunk %s", i + 1, total, chunk_id)
-        user = _build_prompt(ch, schema_card)
-
-        for attempt in range(3):
-            try:
-                data = _chat_json(system, user)
-                n_cls = len((data.get("proposed_additions") or {}).get("classes", []))
-                n_dp = len((data.get("proposed_additions") or {}).get("datatype_properties", []))
-                n_op = len((data.get("proposed_additions") or {}).get("object_properties", []))
-                _log.debug("  -> proposals: classes=%d dt_props=%d obj_props=%d", n_cls, n_dp, n_op)
-                out.append(data)
-                if on_chunk_done:
-                    on_chunk_done(i, total, chunk_id, data)
-                break
-            except Exception as e:
-                _log.info("  Retry %d/3 for chunk %s: %s", attempt + 1, chunk_id, e)
-                if attempt == 2:
-                    raise
-                time.sleep(1.5 * (attempt + 1))
-
-        if i < total - 1:
-            _log.debug("  Rate-limit pause (10s)")
-            time.sleep(10)
+        data = by_id.get(chunk_id)
+        if data is None:
+            data = {
+                "chunk_id": chunk_id,
+                "proposed_additions": {
+                    "classes": [], "datatype_properties": [],
+                    "object_properties": [], "events": [],
+                },
+                "reuse_instead_of_create": [],
+                "alias_or_merge_suggestions": [],
+                "warnings": [f"batch returned no usable result for {chunk_id}"],
+            }
+        out.append(data)
+
+    _log.info("Schema extraction complete: %d proposals from %d chunks", len(out), total)
+    return out
+
+
+async def extract_schema_chunk_proposals_async(
+    chunks: List[Dict[str, Any]],
+    schema_card: Dict[str, Any],
+    on_chunk_done: Optional[ChunkProgressCallback] = None,
+    concurrency: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Async variant of :func:`extract_schema_chunk_proposals`."""
+    total = len(chunks)
+    _log.info("Schema extraction: %d chunks, model=%s", total, OPENROUTER_MODEL)
+
+    jobs, job_of = _prepare_jobs(chunks, schema_card)
+    results = await openrouter.gather_chat_json(
+        jobs, concurrency=concurrency,
+        on_done=_wrap_progress(chunks, job_of, on_chunk_done),
+    )
+    out = _fan_out(chunks, job_of, results)
 
     _log.info("Schema extraction complete: %d proposals from %d chunks", len(out), total)
     return out
@@ -0,0 +1,363 @@
+# ontorag/openrouter.py
+"""
+Shared OpenRouter chat-completion driver.
+
+Both extractors (schema induction and instance extraction) issue the
+same kind of request: a (system, user) prompt pair that must come back
+as strict JSON.  This module owns that plumbing once — concurrent
+dispatch over httpx with a bounded semaphore, per-job retries with
+exponential backoff, and fence-stripping JSON parsing — so the
+extractors only build prompts and interpret results.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import re
+import time
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+import orjson
+
+from ontorag import llm_cache
+from ontorag.rate_limiter import AdaptiveLimiter
+from ontorag.verbosity import get_logger
+
+_log = get_logger("ontorag.openrouter")
+
+OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
+OPENROUTER_MODEL = os.getenv("OPENROUTER_MODEL", "openai/gpt-4o-mini")
+OPENROUTER_BASE_URL = os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1")
+
+APP_NAME = os.getenv("OPENROUTER_APP_NAME", "OntoRAG")
+SITE_URL = os.getenv("OPENROUTER_SITE_URL", "https://ontorag.github.io")
+
+# How many chat calls run in flight at once.
+CONCURRENCY = int(os.getenv("ONTORAG_EXTRACT_CONCURRENCY", "8"))
+
+# (job_index, total_jobs, parsed_result) → None
+JobDoneCallback = Callable[[int, int, Dict[str, Any]], None]
+
+# One pooled client per event loop, shared across all chat calls on
+# that loop: TLS handshakes happen once per connection, and HTTP/2
+# multiplexes the concurrent chunk requests over a handful of sockets
+# instead of one socket each.  Like the limiter below, the async
+# client cannot be process-global — its keep-alive transports bind to
+# the loop they were opened on, and gather_chat_json_sync runs a fresh
+# loop per call.  Per-call timeouts are passed at request time.
+_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+_DEFAULT_HEADERS = {"HTTP-Referer": SITE_URL, "X-Title": APP_NAME}
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+_sync_client = httpx.Client(
+    http2=True, timeout=120.0, limits=_LIMITS, headers=_DEFAULT_HEADERS,
+)
+
+
+def _default_async_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = httpx.AsyncClient(
+            http2=True, timeout=90.0, limits=_LIMITS, headers=_DEFAULT_HEADERS,
+        )
+    return client
+
+
+async def close_http_client() -> None:
+    """Close this loop's shared async client (call once on app shutdown)."""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+# Shared limiters pacing the default-concurrency fan-out from server
+# rate headers; callers that pick their own concurrency get their own.
+# Keyed by event loop: asyncio.Semaphore binds to the first loop it
+# waits in, and gather_chat_json_sync starts a fresh loop per call, so
+# a single module-level limiter would raise "bound to a different
+# event loop" on the second sync gather in one process.
+_limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AdaptiveLimiter]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _default_limiter() -> AdaptiveLimiter:
+    loop = asyncio.get_running_loop()
+    limiter = _limiters.get(loop)
+    if limiter is None:
+        limiter = _limiters[loop] = AdaptiveLimiter(CONCURRENCY)
+    return limiter
+
+
+# Markdown fence unwrapping as a single compiled pattern: one linear
+# scan instead of strip/split/startswith passes that each allocate a
+# substring of the full payload.
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*\n?(.*?)\n?\s*```", re.DOTALL)
+
+
+def parse_chat_content(content: str) -> Dict[str, Any]:
+    """Parse a model reply as JSON, stripping Markdown fences if present."""
+    m = _FENCE_RE.match(content)
+    return orjson.loads(m.group(1) if m else content)
+
+
+def _request_body(system: str, user: str, temperature: float = 0.2) -> Dict[str, Any]:
+    return {
+        "model": OPENROUTER_MODEL,
+        "messages": [
+            {"role": "system", "content": system},
+            {"role": "user", "content": user},
+        ],
+        "temperature": temperature,
+    }
+
+
+def _headers() -> Dict[str, str]:
+    return {
+        "Authorization": f"Bearer {OPENROUTER_API_KEY}",
+        "Content-Type": "application/json",
+        "HTTP-Referer": SITE_URL,
+        "X-Title": APP_NAME,
+    }
+
+
+def _auth_headers() -> Dict[str, str]:
+    return {"Authorization": f"Bearer {OPENROUTER_API_KEY}"}
+
+
+async def chat_json(
+    system: str,
+    user: str,
+    timeout: Optional[float] = None,
+    limiter: Optional[AdaptiveLimiter] = None,
+) -> Dict[str, Any]:
+    """One chat completion over the shared client, parsed as strict JSON."""
+    if not OPENROUTER_API_KEY:
+        raise RuntimeError("OPENROUTER_API_KEY is not set")
+
+    cache_key: Optional[str] = None
+    if llm_cache.enabled():
+        cache_key = llm_cache.cache_key(OPENROUTER_MODEL, system, user)
+        hit = llm_cache.get(cache_key)
+        if hit is not None:
+            return hit
+
+    _log.debug("API request: model=%s prompt_len=%d", OPENROUTER_MODEL, len(user))
+    r = await _default_async_client().post(
+        f"{OPENROUTER_BASE_URL}/chat/completions",
+        headers=_headers(),
+        content=orjson.dumps(_request_body(system, user)),
+        timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+    )
+    if limiter is not None:
+        if r.status_code == 429:
+            try:
+                retry_after = float(r.headers.get("Retry-After", "1"))
+            except ValueError:
+                retry_after = 1.0
+            limiter.throttle(retry_after)
+        else:
+            limiter.update(r.headers)
+    r.raise_for_status()
+    content = orjson.loads(r.content)["choices"][0]["message"]["content"]
+    _log.debug("API response: %d chars", len(content))
+    cache_hit = r.headers.get("x-prompt-cache-hit-tokens")
+    if cache_hit is not None:
+        _log.debug("Prefix cache hit: %s tokens", cache_hit)
+    data = parse_chat_content(content)
+    if cache_key is not None:
+        llm_cache.put(cache_key, data)
+    return data
+
+
+async def gather_chat_json(
+    jobs: List[Tuple[str, str]],
+    concurrency: Optional[int] = None,
+    max_retries: int = 3,
+    timeout: float = 90.0,
+    on_done: Optional[JobDoneCallback] = None,
+) -> List[Dict[str, Any]]:
+    """Run (system, user) chat jobs concurrently, preserving job order.
+
+    LLM calls are pure network wait, so jobs fan out under an
+    :class:`AdaptiveLimiter` — total wall time drops by roughly the
+    concurrency factor versus a sequential loop, while server rate
+    headers pace admissions.  Each job retries up to ``max_retries``
+    times with a linear backoff before its error propagates.
+    """
+    total = len(jobs)
+    limiter = _default_limiter() if concurrency is None else AdaptiveLimiter(concurrency)
+    results: List[Optional[Dict[str, Any]]] = [None] * total
+
+    async def _one(i: int, system: str, user: str) -> None:
+        async with limiter:
+            for attempt in range(max_retries):
+                try:
+                    data = await chat_json(system, user, timeout=timeout, limiter=limiter)
+                    if on_done:
+                        on_done(i, total, data)
+                    results[i] = data
+                    return
+                except Exception as e:
+                    _log.info("  Retry %d/%d for job %d: %s", attempt + 1, max_retries, i, e)
+                    if attempt == max_retries - 1:
+                        raise
+                    await asyncio.sleep(1.5 * (attempt + 1))
+
+    # Admit shortest prompts first: jobs sharing a static prefix land
+    # back-to-back while the provider's prefix cache is warm, and
+    # short-job-first keeps the limiter's slots turning over.  Results
+    # are written by original index, so output order is unchanged.
+    order = sorted(range(total), key=lambda i: len(jobs[i][1]))
+    await asyncio.gather(*(_one(i, *jobs[i]) for i in order))
+    return results  # type: ignore[return-value]
+
+
+def chat_json_sync(
+    system: str,
+    user: str,
+    temperature: float = 0.2,
+    timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+    """One blocking chat completion over the shared sync client.
+
+    For low-volume callers (alignment runs a handful of calls) that
+    don't want an event loop; the body is orjson-encoded once instead
+    of going through the client's stdlib-json kwarg.
+    """
+    if not OPENROUTER_API_KEY:
+        raise RuntimeError("OPENROUTER_API_KEY is not set")
+
+    cache_key: Optional[str] = None
+    if llm_cache.enabled():
+        cache_key = llm_cache.cache_key(OPENROUTER_MODEL, system, user)
+        hit = llm_cache.get(cache_key)
+        if hit is not None:
+            return hit
+
+    _log.debug("API request: model=%s prompt_len=%d", OPENROUTER_MODEL, len(user))
+    r = _sync_client.post(
+        f"{OPENROUTER_BASE_URL}/chat/completions",
+        headers=_headers(),
+        content=orjson.dumps(_request_body(system, user, temperature=temperature)),
+        timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
+    )
+    r.raise_for_status()
+    content = orjson.loads(r.content)["choices"][0]["message"]["content"]
+    _log.debug("API response: %d chars", len(content))
+    data = parse_chat_content(content)
+    if cache_key is not None:
+        llm_cache.put(cache_key, data)
+    return data
+
+
+def batch_chat_json(
+    jobs: List[Tuple[str, str, str]],
+    poll_interval: float = 30.0,
+    completion_window: str = "24h",
+) -> Dict[str, Dict[str, Any]]:
+    """Run (custom_id, system, user) jobs through the provider Batch API.
+
+    For offline, non-interactive workloads the Batch API is both cheaper
+    per token and free of rate-limit juggling: all requests go up as one
+    JSONL file, the provider schedules them, and we poll until the batch
+    completes.  Requires an OpenAI-compatible ``/files`` + ``/batches``
+    endpoint behind ``OPENROUTER_BASE_URL``.
+
+    Returns parsed results keyed by ``custom_id``; jobs whose reply
+    could not be parsed are omitted (logged at info level).
+    """
+    if not OPENROUTER_API_KEY:
+        raise RuntimeError("OPENROUTER_API_KEY is not set")
+
+    lines = bytearray()
+    for custom_id, system, user in jobs:
+        lines += orjson.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": _request_body(system, user),
+        })
+        lines += b"\n"
+
+    r = _sync_client.post(
+        f"{OPENROUTER_BASE_URL}/files",
+        headers=_auth_headers(),
+        data={"purpose": "batch"},
+        files={"file": ("ontorag-batch.jsonl", bytes(lines), "application/jsonl")},
+    )
+    r.raise_for_status()
+    input_file_id = r.json()["id"]
+    _log.info("Batch input uploaded: %s (%d jobs)", input_file_id, len(jobs))
+
+    r = _sync_client.post(
+        f"{OPENROUTER_BASE_URL}/batches",
+        headers=_headers(),
+        json={
+            "input_file_id": input_file_id,
+            "endpoint": "/v1/chat/completions",
+            "completion_window": completion_window,
+        },
+    )
+    r.raise_for_status()
+    batch_id = r.json()["id"]
+    _log.info("Batch submitted: %s", batch_id)
+
+    while True:
+        r = _sync_client.get(f"{OPENROUTER_BASE_URL}/batches/{batch_id}", headers=_auth_headers())
+        r.raise_for_status()
+        batch = r.json()
+        status = batch.get("status")
+        if status == "completed":
+            break
+        if status in ("failed", "expired", "cancelled"):
+            raise RuntimeError(f"Batch {batch_id} ended with status {status!r}")
+        _log.debug("Batch %s status=%s; polling again in %.0fs", batch_id, status, poll_interval)
+        time.sleep(poll_interval)
+
+    output_file_id = batch["output_file_id"]
+    r = _sync_client.get(f"{OPENROUTER_BASE_URL}/files/{output_file_id}/content", headers=_auth_headers())
+    r.raise_for_status()
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for ln in r.content.splitlines():
+        if not ln:
+            continue
+        row = orjson.loads(ln)
+        custom_id = row.get("custom_id", "")
+        try:
+            content = row["response"]["body"]["choices"][0]["message"]["content"]
+            results[custom_id] = parse_chat_content(content)
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            _log.info("Batch result for %s unusable: %s", custom_id, e)
+    _log.info("Batch %s complete: %d/%d usable results", batch_id, len(results), len(jobs))
+    return results
+
+
+def gather_chat_json_sync(
+    jobs: List[Tuple[str, str]],
+    concurrency: Optional[int] = None,
+    max_retries: int = 3,
+    timeout: float = 90.0,
+    on_done: Optional[JobDoneCallback] = None,
+) -> List[Dict[str, Any]]:
+    """Synchronous entry point for CLI callers — runs the async driver.
+
+    The event loop only lives for this call, so the loop's pooled
+    client is closed before the loop is torn down — its connections
+    can't be reused afterwards anyway.
+    """
+    async def _run() -> List[Dict[str, Any]]:
+        try:
+            return await gather_chat_json(
+                jobs, concurrency=concurrency, max_retries=max_retries,
+                timeout=timeout, on_done=on_done,
+            )
+        finally:
+            await close_http_client()
+
+    return asyncio.run(_run())
@@ -1,5 +1,6 @@
 # ontorag/proposal_aggregator.py
 from __future__ import annotations
+import sys
 from typing import List, Dict, Any, Tuple
 
 from ontorag.verbosity import get_logger
@@ -7,7 +8,9 @@ from ontorag.verbosity import get_logger
 _log = get_logger("ontorag.proposal_aggregator")
 
 def _key(name: str) -> str:
-    return (name or "").strip().lower()
+    # Interned: the same names recur across thousands of proposals, so
+    # bucket lookups compare by pointer and duplicates share storage.
+    return sys.intern((name or "").strip().lower())
 
 def _as_list(x):
     if x is None:
@@ -55,28 +58,50 @@ def _normalize_evidence(ev: Any, default_chunk_id: str = "") -> List[Dict[str, s
 
     return out
 
+def _merge_description(entry: Dict[str, Any], new_desc: Any) -> None:
+    """Keep the non-empty / longer description."""
+    new_desc = new_desc or ""
+    old_desc = entry.get("description", "") or ""
+    if new_desc and (not old_desc or len(new_desc) > len(old_desc)):
+        entry["description"] = new_desc
+
+
+def _merge_evidence(entry: Dict[str, Any], seen: set, new_ev: Any, default_chunk_id: str) -> None:
+    """Append evidence not already in ``entry``.
+
+    ``seen`` is the entry's sibling set of (chunk_id, quote) pairs,
+    kept alive across merges — membership is O(1) instead of
+    re-normalizing and re-hashing the whole evidence list per merge.
+    """
+    evidence = entry["evidence"]
+    for e in _normalize_evidence(new_ev, default_chunk_id=default_chunk_id):
+        t = (e["chunk_id"], e["quote"])
+        if t not in seen:
+            evidence.append(e)
+            seen.add(t)
+
+
 def aggregate_chunk_proposals(chunk_props: List[Dict[str, Any]]) -> Dict[str, Any]:
     _log.info("Aggregating %d chunk proposals", len(chunk_props))
 
-    classes: Dict[str, Dict[str, Any]] = {}
-    dprops: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
-    oprops: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
-    events: Dict[str, Dict[str, Any]] = {}
+    # Buckets keyed by tagged tuples (the tag keeps evidence_seen keys
+    # distinct across buckets).
+    classes: Dict[Tuple, Dict[str, Any]] = {}
+    dprops: Dict[Tuple, Dict[str, Any]] = {}
+    oprops: Dict[Tuple, Dict[str, Any]] = {}
+    events: Dict[Tuple, Dict[str, Any]] = {}
 
-    warnings: List[str] = []
-    merges: List[dict] = []
+    # Sibling (chunk_id, quote) sets, one per bucket entry, so evidence
+    # dedup never rescans the accumulated lists.
+    evidence_seen: Dict[Any, set] = {}
 
-    def merge_evidence(existing_ev: Any, new_ev: Any, default_chunk_id: str) -> List[Dict[str, str]]:
-        existing = _normalize_evidence(existing_ev, default_chunk_id=default_chunk_id)
-        new = _normalize_evidence(new_ev, default_chunk_id=default_chunk_id)
+    def _init_evidence(bucket_key: Any, ev: Any, default_chunk_id: str) -> List[Dict[str, str]]:
+        evidence = _normalize_evidence(ev, default_chunk_id=default_chunk_id)
+        evidence_seen[bucket_key] = {(e["chunk_id"], e["quote"]) for e in evidence}
+        return evidence
 
-        seen = {(e["chunk_id"], e["quote"]) for e in existing}
-        for e in new:
-            t = (e["chunk_id"], e["quote"])
-            if t not in seen:
-                existing.append(e)
-                seen.add(t)
-        return existing
+    warnings: List[str] = []
+    merges: List[dict] = []
 
     for cp in chunk_props:
         cp_chunk_id = str(cp.get("chunk_id") or "")
@@ -94,25 +119,17 @@ def aggregate_chunk_proposals(chunk_props: List[Dict[str, Any]]) -> Dict[str, An
             name = c.get("name")
             if not name:
                 continue
-            k = _key(name)
-            if k not in classes:
+            k = ("class", _key(name))
+            entry = classes.get(k)
+            if entry is None:
                 classes[k] = {
                     "name": name,
                     "description": c.get("description", "") or "",
-                    "evidence": _normalize_evidence(c.get("evidence", []), default_chunk_id=cp_chunk_id)
+                    "evidence": _init_evidence(k, c.get("evidence", []), cp_chunk_id),
                 }
             else:
-                # merge description (prefer non-empty / longer)
-                old_desc = classes[k].get("description", "") or ""
-                new_desc = c.get("description", "") or ""
-                if new_desc and (not old_desc or len(new_desc) > len(old_desc)):
-                    classes[k]["description"] = new_desc
-
-                classes[k]["evidence"] = merge_evidence(
-                    classes[k].get("evidence", []),
-                    c.get("evidence", []),
-                    default_chunk_id=cp_chunk_id
-                )
+                _merge_description(entry, c.get("description"))
+                _merge_evidence(entry, evidence_seen[k], c.get("evidence", []), cp_chunk_id)
 
         # ---- datatype properties ----
         for p in _as_list(add.get("datatype_properties", [])):
@@ -121,26 +138,19 @@ def aggregate_chunk_proposals(chunk_props: List[Dict[str, Any]]) -> Dict[str, An
             dom, name, rng = p.get("domain"), p.get("name"), p.get("range")
             if not dom or not name or not rng:
                 continue
-            k = (_key(dom), _key(name), _key(rng))
-            if k not in dprops:
+            k = ("dprop", _key(dom), _key(name), _key(rng))
+            entry = dprops.get(k)
+            if entry is None:
                 dprops[k] = {
                     "name": name,
                     "domain": dom,
                     "range": rng,
                     "description": p.get("description", "") or "",
-                    "evidence": _normalize_evidence(p.get("evidence", []), default_chunk_id=cp_chunk_id)
+                    "evidence": _init_evidence(k, p.get("evidence", []), cp_chunk_id),
                 }
             else:
-                old_desc = dprops[k].get("description", "") or ""
-                new_desc = p.get("description", "") or ""
-                if new_desc and (not old_desc or len(new_desc) > len(old_desc)):
-                    dprops[k]["description"] = new_desc
-
-                dprops[k]["evidence"] = merge_evidence(
-                    dprops[k].get("evidence", []),
-                    p.get("evidence", []),
-                    default_chunk_id=cp_chunk_id
-                )
+                _merge_description(entry, p.get("description"))
+                _merge_evidence(entry, evidence_seen[k], p.get("evidence", []), cp_chunk_id)
 
         # ---- object properties ----
         for p in _as_list(add.get("object_properties", [])):
@@ -149,26 +159,19 @@ def aggregate_chunk_proposals(chunk_props: List[Dict[str, Any]]) -> Dict[str, An
             dom, name, rng = p.get("domain"), p.get("name"), p.get("range")
             if not dom or not name or not rng:
                 continue
-            k = (_key(dom), _key(name), _key(rng))
-            if k not in oprops:
+            k = ("oprop", _key(dom), _key(name), _key(rng))
+            entry = oprops.get(k)
+            if entry is None:
                 oprops[k] = {
                     "name": name,
                     "domain": dom,
                     "range": rng,
                     "description": p.get("description", "") or "",
-                    "evidence": _normalize_evidence(p.get("evidence", []), default_chunk_id=cp_chunk_id)
+                    "evidence": _init_evidence(k, p.get("evidence", []), cp_chunk_id),
                 }
             else:
-                old_desc = oprops[k].get("description", "") or ""
-                new_desc = p.get("description", "") or ""
-                if new_desc and (not old_desc or len(new_desc) > len(old_desc)):
-                    oprops[k]["description"] = new_desc
-
-                oprops[k]["evidence"] = merge_evidence(
-                    oprops[k].get("evidence", []),
-                    p.get("evidence", []),
-                    default_chunk_id=cp_chunk_id
-                )
+                _merge_description(entry, p.get("description"))
+                _merge_evidence(entry, evidence_seen[k], p.get("evidence", []), cp_chunk_id)
 
         # ---- events ----
         for ev in _as_list(add.get("events", [])):
@@ -177,28 +180,21 @@ def aggregate_chunk_proposals(chunk_props: List[Dict[str, Any]]) -> Dict[str, An
             name = ev.get("name")
             if not name:
                 continue
-            k = _key(name)
-            if k not in events:
+            k = ("event", _key(name))
+            entry = events.get(k)
+            if entry is None:
                 events[k] = {
                     "name": name,
                     "actors": _as_list(ev.get("actors", [])),
                     "effects": _as_list(ev.get("effects", [])),
                     "description": ev.get("description", "") or "",
-                    "evidence": _normalize_evidence(ev.get("evidence", []), default_chunk_id=cp_chunk_id)
+                    "evidence": _init_evidence(k, ev.get("evidence", []), cp_chunk_id),
                 }
             else:
-                events[k]["actors"] = sorted(set(events[k].get("actors", [])) | set(_as_list(ev.get("actors", []))))
-                events[k]["effects"] = sorted(set(events[k].get("effects", [])) | set(_as_list(ev.get("effects", []))))
-                old_desc = events[k].get("description", "") or ""
-                new_desc = ev.get("description", "") or ""
-                if new_desc and (not old_desc or len(new_desc) > len(old_desc)):
-                    events[k]["description"] = new_desc
-
-                events[k]["evidence"] = merge_evidence(
-                    events[k].get("evidence", []),
-                    ev.get("evidence", []),
-                    default_chunk_id=cp_chunk_id
-                )
+                entry["actors"] = sorted(set(entry.get("actors", [])) | set(_as_list(ev.get("actors", []))))
+                entry["effects"] = sorted(set(entry.get("effects", [])) | set(_as_list(ev.get("effects", []))))
+                _merge_description(entry, ev.get("description"))
+                _merge_evidence(entry, evidence_seen[k], ev.get("evidence", []), cp_chunk_id)
 
     # dedup warnings stable
     warnings_out = []
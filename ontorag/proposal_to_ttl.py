@@ -1,6 +1,9 @@
 # proposal_to_ttl.py
 from __future__ import annotations
-from typing import Optional
+import re
+import sys
+from io import StringIO
+from typing import Dict, Optional
 from rdflib import Graph, Namespace, Literal, URIRef
 from rdflib.namespace import RDF, RDFS, OWL, XSD
 
@@ -9,15 +12,17 @@ from ontorag.verbosity import get_logger
 
 _log = get_logger("ontorag.proposal_to_ttl")
 
+# Keys interned so the lowercased range strings coming off proposals
+# hit pointer-equality fast paths during lookup.
 _RANGE_MAP = {
-    "string": XSD.string,
-    "number": XSD.decimal,
-    "integer": XSD.integer,
-    "boolean": XSD.boolean,
-    "date": XSD.date,
-    "datetime": XSD.dateTime,
-    "enum": XSD.string,
-    "any": XSD.string,
+    sys.intern("string"): XSD.string,
+    sys.intern("number"): XSD.decimal,
+    sys.intern("integer"): XSD.integer,
+    sys.intern("boolean"): XSD.boolean,
+    sys.intern("date"): XSD.date,
+    sys.intern("datetime"): XSD.dateTime,
+    sys.intern("enum"): XSD.string,
+    sys.intern("any"): XSD.string,
 }
 
 
@@ -44,42 +49,149 @@ def proposal_to_ttl(
     g.bind("owl", OWL)
     g.bind("rdfs", RDFS)
 
+    # Triples collect into one list and land via a single addN call —
+    # one store entry instead of a per-triple add() dispatch.  Domain
+    # and range names repeat heavily, so URIRefs are memoized by name.
+    base = str(BIZ)
+    uri_cache: Dict[str, URIRef] = {}
+
+    def biz(name: str) -> URIRef:
+        ref = uri_cache.get(name)
+        if ref is None:
+            ref = uri_cache[name] = URIRef(base + name)
+        return ref
+
+    quads = []
+    add = quads.append
+
     # classes
     for c in agg.get("classes", []):
-        cls = URIRef(str(BIZ) + c["name"])
-        g.add((cls, RDF.type, OWL.Class))
+        cls = biz(c["name"])
+        add((cls, RDF.type, OWL.Class, g))
         if c.get("description"):
-            g.add((cls, RDFS.comment, Literal(c["description"])))
+            add((cls, RDFS.comment, Literal(c["description"]), g))
         if c.get("subclass_of"):
-            g.add((cls, RDFS.subClassOf, URIRef(str(BIZ) + c["subclass_of"])))
+            add((cls, RDFS.subClassOf, biz(c["subclass_of"]), g))
 
     # datatype properties
+    range_get = _RANGE_MAP.get
     for p in agg.get("datatype_properties", []):
-        prop = URIRef(str(BIZ) + p["name"])
-        dom = URIRef(str(BIZ) + p["domain"])
-        rng = _RANGE_MAP.get(p.get("range", "string").lower(), XSD.string)
+        prop = biz(p["name"])
+        rng = range_get(p.get("range", "string").lower(), XSD.string)
 
-        g.add((prop, RDF.type, OWL.DatatypeProperty))
-        g.add((prop, RDFS.domain, dom))
-        g.add((prop, RDFS.range, rng))
+        add((prop, RDF.type, OWL.DatatypeProperty, g))
+        add((prop, RDFS.domain, biz(p["domain"]), g))
+        add((prop, RDFS.range, rng, g))
         if p.get("description"):
-            g.add((prop, RDFS.comment, Literal(p["description"])))
+            add((prop, RDFS.comment, Literal(p["description"]), g))
         if p.get("subproperty_of"):
-            g.add((prop, RDFS.subPropertyOf, URIRef(str(BIZ) + p["subproperty_of"])))
+            add((prop, RDFS.subPropertyOf, biz(p["subproperty_of"]), g))
 
     # object properties
     for p in agg.get("object_properties", []):
-        prop = URIRef(str(BIZ) + p["name"])
-        dom = URIRef(str(BIZ) + p["domain"])
-        rng = URIRef(str(BIZ) + p["range"])
+        prop = biz(p["name"])
 
-        g.add((prop, RDF.type, OWL.ObjectProperty))
-        g.add((prop, RDFS.domain, dom))
-        g.add((prop, RDFS.range, rng))
+        add((prop, RDF.type, OWL.ObjectProperty, g))
+        add((prop, RDFS.domain, biz(p["domain"]), g))
+        add((prop, RDFS.range, biz(p["range"]), g))
         if p.get("description"):
-            g.add((prop, RDFS.comment, Literal(p["description"])))
+            add((prop, RDFS.comment, Literal(p["description"]), g))
         if p.get("subproperty_of"):
-            g.add((prop, RDFS.subPropertyOf, URIRef(str(BIZ) + p["subproperty_of"])))
+            add((prop, RDFS.subPropertyOf, biz(p["subproperty_of"]), g))
+
+    g.addN(quads)
 
     _log.info("TTL graph built: %d triples", len(g))
     return g
+
+
+# ── Direct Turtle writer ──────────────────────────────────────────────
+#
+# Write-only exports don't need rdflib's indexed triple store at all;
+# emitting Turtle text in one pass skips every per-triple store entry
+# and the serializer walk afterwards.
+
+_RANGE_QNAME = {
+    "string": "xsd:string",
+    "number": "xsd:decimal",
+    "integer": "xsd:integer",
+    "boolean": "xsd:boolean",
+    "date": "xsd:date",
+    "datetime": "xsd:dateTime",
+    "enum": "xsd:string",
+    "any": "xsd:string",
+}
+
+# Names safe to emit as a prefixed biz: local part.
+_PNAME_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_\-]*$")
+
+
+def _ttl_escape(s: str) -> str:
+    return (
+        s.replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def proposal_to_ttl_fast(
+    agg: dict,
+    biz_ns: str = "http://www.example.com/biz/",
+    original_proposal: Optional[dict] = None,
+) -> str:
+    """Serialize a schema proposal straight to Turtle text.
+
+    Equivalent output to ``proposal_to_ttl(...).serialize(format="turtle")``
+    for this fixed shape, without building a graph first.
+    """
+    agg = normalize_alignment(agg, original_proposal=original_proposal)
+
+    def ref(name: str) -> str:
+        if _PNAME_RE.match(name):
+            return f"biz:{name}"
+        return f"<{biz_ns}{name}>"
+
+    out = StringIO()
+    w = out.write
+    w(f"@prefix biz: <{biz_ns}> .\n")
+    w("@prefix owl: <http://www.w3.org/2002/07/owl#> .\n")
+    w("@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .\n")
+    w("@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .\n\n")
+
+    for c in agg.get("classes", []):
+        w(f"{ref(c['name'])} a owl:Class")
+        if c.get("description"):
+            w(f' ;\n    rdfs:comment "{_ttl_escape(c["description"])}"')
+        if c.get("subclass_of"):
+            w(f" ;\n    rdfs:subClassOf {ref(c['subclass_of'])}")
+        w(" .\n\n")
+
+    for p in agg.get("datatype_properties", []):
+        rng = _RANGE_QNAME.get(p.get("range", "string").lower(), "xsd:string")
+        w(f"{ref(p['name'])} a owl:DatatypeProperty ;\n")
+        w(f"    rdfs:domain {ref(p['domain'])} ;\n")
+        w(f"    rdfs:range {rng}")
+        if p.get("description"):
+            w(f' ;\n    rdfs:comment "{_ttl_escape(p["description"])}"')
+        if p.get("subproperty_of"):
+            w(f" ;\n    rdfs:subPropertyOf {ref(p['subproperty_of'])}")
+        w(" .\n\n")
+
+    for p in agg.get("object_properties", []):
+        w(f"{ref(p['name'])} a owl:ObjectProperty ;\n")
+        w(f"    rdfs:domain {ref(p['domain'])} ;\n")
+        w(f"    rdfs:range {ref(p['range'])}")
+        if p.get("description"):
+            w(f' ;\n    rdfs:comment "{_ttl_escape(p["description"])}"')
+        if p.get("subproperty_of"):
+            w(f" ;\n    rdfs:subPropertyOf {ref(p['subproperty_of'])}")
+        w(" .\n\n")
+
+    _log.info(
+        "TTL text built: %d classes, %d dt_props, %d obj_props",
+        len(agg.get("classes", [])),
+        len(agg.get("datatype_properties", [])),
+        len(agg.get("object_properties", [])),
+    )
+    return out.getvalue()
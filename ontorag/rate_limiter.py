@@ -0,0 +1,98 @@
+# ontorag/rate_limiter.py
+"""
+Header-aware adaptive pacing for LLM API calls.
+
+Fixed sleeps either over-wait on healthy runs or under-wait on
+throttled ones.  :class:`AdaptiveLimiter` bounds in-flight requests
+with a semaphore and paces admissions from what the server actually
+reports: ``x-ratelimit-remaining`` / ``x-ratelimit-reset`` on normal
+responses and ``Retry-After`` on 429s.  When a provider sends no rate
+headers it falls back to AIMD spacing — multiplicative increase on
+throttle, additive decrease on clean responses.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Mapping, Optional
+
+from ontorag.verbosity import get_logger
+
+_log = get_logger("ontorag.rate_limiter")
+
+
+def _reset_in_seconds(value: str) -> float:
+    """Normalize an ``x-ratelimit-reset`` value to seconds from now.
+
+    Providers disagree on units: OpenRouter sends epoch milliseconds,
+    others epoch seconds or a plain delta.
+    """
+    try:
+        v = float(value)
+    except ValueError:
+        return 1.0
+    now = time.time()
+    if v > 1e12:  # epoch milliseconds
+        return max(0.0, v / 1000.0 - now)
+    if v > 1e9:  # epoch seconds
+        return max(0.0, v - now)
+    return max(0.0, v)
+
+
+class AdaptiveLimiter:
+    """Bounded-concurrency limiter that adapts to server throttle signals.
+
+    Use as an async context manager around each request; feed response
+    headers back via :meth:`update` and report 429s via
+    :meth:`throttle`.
+    """
+
+    def __init__(self, concurrency: int) -> None:
+        self._sem = asyncio.Semaphore(concurrency)
+        self._pause_until = 0.0  # monotonic deadline from explicit throttle signals
+        self._spacing = 0.0  # AIMD inter-admission gap for header-less providers
+        self._last_admit = 0.0
+
+    async def __aenter__(self) -> "AdaptiveLimiter":
+        await self._sem.acquire()
+        try:
+            while True:
+                now = time.monotonic()
+                wait = max(self._pause_until - now, self._last_admit + self._spacing - now)
+                if wait <= 0:
+                    break
+                _log.debug("Limiter pacing: waiting %.2fs", wait)
+                await asyncio.sleep(wait)
+            self._last_admit = time.monotonic()
+        except BaseException:
+            self._sem.release()
+            raise
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self._sem.release()
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """Record rate headers from a successful response."""
+        remaining = headers.get("x-ratelimit-remaining")
+        if remaining is not None:
+            try:
+                if float(remaining) <= 1.0:
+                    reset = headers.get("x-ratelimit-reset")
+                    if reset is not None:
+                        delay = _reset_in_seconds(reset)
+                        _log.debug("Rate budget exhausted; pausing %.2fs until reset", delay)
+                        self._pause_until = max(
+                            self._pause_until, time.monotonic() + delay
+                        )
+            except ValueError:
+                pass
+        # Clean response: additively relax any AIMD spacing.
+        self._spacing = max(0.0, self._spacing - 0.05)
+
+    def throttle(self, retry_after: Optional[float] = None) -> None:
+        """Record a 429 (or equivalent throttle signal)."""
+        if retry_after is not None:
+            self._pause_until = max(self._pause_until, time.monotonic() + retry_after)
+        self._spacing = min(10.0, self._spacing * 2 if self._spacing else 0.5)
+        _log.info("Throttled: retry_after=%s spacing=%.2fs", retry_after, self._spacing)
@@ -12,22 +12,14 @@ set correct ``origin`` values and link back to the source TTLs.
 from __future__ import annotations
 
 import json
-import os
 import time
 from typing import Any, Callable, Dict, List, Optional
 
-import requests
-
+from ontorag.openrouter import chat_json_sync
 from ontorag.verbosity import get_logger
 
 _log = get_logger("ontorag.schema_alignment")
 
-OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
-OPENROUTER_MODEL = os.getenv("OPENROUTER_MODEL", "openai/gpt-4o-mini")
-OPENROUTER_BASE_URL = os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1")
-APP_NAME = os.getenv("OPENROUTER_APP_NAME", "OntoRAG")
-SITE_URL = os.getenv("OPENROUTER_SITE_URL", "https://ontorag.github.io")
-
 AlignProgressCallback = Callable[..., None]
 """(category, category_result, *, resumed=False) → None"""
 
@@ -35,40 +27,8 @@ AlignProgressCallback = Callable[..., None]
 # ── LLM helper ────────────────────────────────────────────────────────
 
 def _chat_json(system: str, user: str) -> Dict[str, Any]:
-    if not OPENROUTER_API_KEY:
-        raise RuntimeError("OPENROUTER_API_KEY is not set")
-
-    url = f"{OPENROUTER_BASE_URL}/chat/completions"
-    headers = {
-        "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-        "Content-Type": "application/json",
-        "HTTP-Referer": SITE_URL,
-        "X-Title": APP_NAME,
-    }
-    payload = {
-        "model": OPENROUTER_MODEL,
-        "messages": [
-            {"role": "system", "content": system},
-            {"role": "user", "content": user},
-        ],
-        "temperature": 0.1,
-    }
-
-    _log.debug("API request: model=%s prompt_len=%d", OPENROUTER_MODEL, len(user))
     _log.debug("API prompt:\n%s", user)
-    r = requests.post(url, headers=headers, json=payload, timeout=120)
-    r.raise_for_status()
-    content = r.json()["choices"][0]["message"]["content"]
-    _log.debug("API response: %d chars", len(content))
-    _log.debug("API raw response:\n%s", content)
-
-    content = content.strip()
-    if content.startswith("```"):
-        content = content.split("```", 2)[1].strip()
-        if content.startswith("json"):
-            content = content[4:].strip()
-
-    return json.loads(content)
+    return chat_json_sync(system, user, temperature=0.1, timeout=120.0)
 
 
 # ── Prompt builders ───────────────────────────────────────────────────